@@ -0,0 +1,10 @@
+"""Solutions to Advent of Code 2023.
+
+Every `dayNN` module is also a standalone script importing `helpers` as a
+top-level package, so the package directory is put on `sys.path` for the
+`mysolution` entry point.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
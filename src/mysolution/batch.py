@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Solves one day against many input files, printing one JSON line per input
+in completion order.
+"""
+from __future__ import annotations
+
+import asyncio
+import glob
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import click
+
+from runner import DayResult, preload, solve_text
+
+
+@click.command()
+@click.argument('day', type=click.IntRange(1, 25))
+@click.argument('inputs', nargs=-1, required=True)
+@click.option('-j', '--jobs', default=os.cpu_count() or 1, show_default=True,
+              type=click.IntRange(1), help="Number of worker processes.")
+@click.option('-c', '--concurrency', default=None, type=click.IntRange(1),
+              help="Maximum number of inputs read and in flight at once.  [default: 2 x jobs]")
+@click.option('--no-cache', is_flag=True, help="Do not use the on-disk caches.")
+def program(day, inputs, jobs, concurrency, no_cache):
+    """Solves DAY on every input in INPUTS, which may be files, directories
+    (all their *.txt files) or glob patterns.
+    """
+    files = expand_inputs(inputs)
+    if not files:
+        raise click.UsageError("No input files found.")
+
+    def emit(result: DayResult) -> None:
+        sys.stdout.write(json.dumps(result.to_json()) + '\n')
+        sys.stdout.flush()
+
+    results = asyncio.run(run_batch(day, files, jobs, concurrency or 2 * jobs, not no_cache, emit))
+    if any(result.error for result in results):
+        sys.exit(1)
+
+
+def expand_inputs(inputs: tuple[str, ...]) -> list[str]:
+    """Lists the input files once each, in the order given.
+    """
+    files = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            files.extend(sorted(str(path) for path in Path(pattern).glob('*.txt')))
+        elif glob.has_magic(pattern):
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            files.append(pattern)  # a missing file is reported in its result
+    return list(dict.fromkeys(files))
+
+
+async def run_batch(day: int, files: list[str], jobs: int, concurrency: int,
+                    use_cache: bool, emit: Callable[[DayResult], None]) -> list[DayResult]:
+    """Reads the files in threads and solves them in a process pool whose
+    workers import the day once. At most `concurrency` inputs are held in
+    memory at a time; results are emitted as they complete.
+    """
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=preload,
+                             initargs=([day], use_cache)) as executor:
+        async def solve_file(path: str) -> DayResult:
+            async with limit:
+                try:
+                    data = await asyncio.to_thread(Path(path).read_bytes)
+                except OSError as exc:
+                    return DayResult(day, path, error=''.join(traceback.format_exception_only(exc)).strip())
+                return await loop.run_in_executor(executor, solve_text, day, data, path)
+
+        results = []
+        for next_result in asyncio.as_completed([solve_file(path) for path in files]):
+            results.append(result := await next_result)
+            emit(result)
+        return results
+
+
+if __name__ == '__main__':
+    program()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Benchmarks parsing and both parts of every day against its puzzle input,
+and compares the results with a stored baseline.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from helpers.registry import PACKAGE_DIR, available_days, get_solution
+
+INPUTS_DIR = Path(PACKAGE_DIR).parents[1] / 'inputs'
+BENCHMARKS_DIR = Path(PACKAGE_DIR).parents[1] / 'benchmarks'
+
+
+@click.command()
+@click.argument('days', nargs=-1, type=click.IntRange(1, 25))
+@click.option('-i', '--inputs', 'inputs_dir', default=INPUTS_DIR, show_default=True,
+              type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Directory containing the dayNN_<suffix>.txt files.")
+@click.option('-s', '--suffix', default='input', show_default=True,
+              help="Input file suffix, e.g. 'sample' for dayNN_sample.txt.")
+@click.option('-r', '--repeat', default=5, show_default=True, type=click.IntRange(1),
+              help="Number of timed runs of each phase.")
+@click.option('-w', '--warmup', default=1, show_default=True, type=click.IntRange(0),
+              help="Number of untimed runs of each phase before timing.")
+@click.option('-o', '--output', type=click.Path(dir_okay=False, path_type=Path),
+              default=BENCHMARKS_DIR / 'results.json', show_default=True,
+              help="Where to write the JSON results.")
+@click.option('-b', '--baseline', type=click.Path(dir_okay=False, path_type=Path),
+              default=BENCHMARKS_DIR / 'baseline.json', show_default=True,
+              help="Baseline results to compare against (skipped if missing).")
+@click.option('-t', '--threshold', default=0.25, show_default=True, type=click.FloatRange(0),
+              help="Allowed relative slowdown of a phase's median before failing.")
+@click.option('--min-delta', default=0.005, show_default=True, type=click.FloatRange(0),
+              help="Slowdowns smaller than this many seconds are treated as noise.")
+@click.option('--save-baseline', is_flag=True,
+              help="Store the results as the new baseline instead of comparing.")
+@click.option('--imports', is_flag=True,
+              help="Also time importing each day module in a fresh interpreter.")
+@click.option('--import-budget', default=0.1, show_default=True, type=click.FloatRange(0),
+              help="Fails when a day module takes longer than this many seconds to import.")
+@click.option('--memory', is_flag=True,
+              help="Also measure the memory held by each parsed puzzle, per record.")
+def program(days, inputs_dir, suffix, repeat, warmup, output, baseline,
+            threshold, min_delta, save_baseline, imports, import_budget, memory):
+    """Benchmarks DAYS (all days by default).
+    """
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'repeat': repeat,
+            'warmup': warmup,
+            'suffix': suffix,
+        },
+        'days': {},
+    }
+    if memory:
+        results['memory'] = {}
+
+    for day in days or available_days():
+        input_file = inputs_dir / f'day{day:02d}_{suffix}.txt'
+        if not input_file.exists():
+            click.echo(f"Day {day:02d}: skipped, {input_file} not found", err=True)
+            continue
+
+        timings = {}
+        if imports:
+            timings['import'] = summarize(
+                [import_time(day) for _ in range(warmup + repeat)][warmup:]
+            )
+        timings |= benchmark_day(day, input_file.read_text(), repeat, warmup)
+        results['days'][f'{day:02d}'] = timings
+        click.echo(f"Day {day:02d}  " + "  ".join(
+            f"{phase} {stats['median']:.4f}s" for phase, stats in timings.items()
+        ))
+
+        if memory:
+            results['memory'][f'{day:02d}'] = usage = puzzle_memory(day, input_file.read_text())
+            click.echo(f"Day {day:02d}  {usage['records']} records  "
+                       f"parsed {usage['parsed'] / usage['records']:.0f} B/record  "
+                       f"solved {usage['solved'] / usage['records']:.0f} B/record")
+
+    output = baseline if save_baseline else output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + '\n')
+    click.echo(f"Results written to {output}")
+
+    over_budget = [
+        (day, timings['import']['median'])
+        for day, timings in results['days'].items()
+        if 'import' in timings and timings['import']['median'] > import_budget
+    ]
+    for day, elapsed in over_budget:
+        click.echo(f"OVER BUDGET day {day} import: {elapsed:.4f}s > {import_budget:.4f}s", err=True)
+
+    regressions = []
+    if not save_baseline and baseline.exists():
+        regressions = compare(json.loads(baseline.read_text()), results, threshold, min_delta)
+    for day, phase, old, new in regressions:
+        click.echo(f"REGRESSION day {day} {phase}: {old:.4f}s -> {new:.4f}s "
+                   f"({new / old - 1:+.0%})", err=True)
+
+    if regressions or over_budget:
+        sys.exit(1)
+
+
+def benchmark_day(day: int, text: str, repeat: int, warmup: int) -> dict[str, dict]:
+    """Times each phase of a day separately. The parts are timed on a freshly
+    parsed puzzle every run so that no run benefits from work cached by the
+    previous one.
+    """
+    solution = get_solution(day)
+    phases = {
+        'parse': lambda puzzle: solution.parse(text),
+        'part1': solution.part1,
+        'part2': solution.part2,
+    }
+
+    timings = {}
+    for phase, func in phases.items():
+        if func is None:
+            continue
+
+        runs = []
+        for run in range(warmup + repeat):
+            puzzle = solution.parse(text) if phase != 'parse' else None
+            start = time.perf_counter()
+            func(puzzle)
+            elapsed = time.perf_counter() - start
+            if run >= warmup:
+                runs.append(elapsed)
+
+        timings[phase] = summarize(runs)
+    return timings
+
+
+def puzzle_memory(day: int, text: str) -> dict[str, int]:
+    """Measures with tracemalloc the memory held by the parsed puzzle, right
+    after parsing and again after solving both parts (which may fill cached
+    properties of the records). Records are the items of a puzzle that is a
+    list, the input lines otherwise.
+    """
+    import gc
+    import tracemalloc
+
+    solution = get_solution(day)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        puzzle = solution.parse(text)
+        parsed = tracemalloc.get_traced_memory()[0] - base
+        for part in (solution.part1, solution.part2):
+            if part is not None:
+                part(puzzle)
+        gc.collect()
+        solved = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+
+    records = len(puzzle) if isinstance(puzzle, list) else len(text.splitlines())
+    return {'records': records, 'parsed': parsed, 'solved': solved}
+
+
+def import_time(day: int) -> float:
+    """Returns the cumulative time, in seconds, reported by `python -X importtime`
+    for importing a day module in a fresh interpreter.
+    """
+    module = f'day{day:02d}'
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PACKAGE_DIR, capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def summarize(runs: list[float]) -> dict:
+    return {
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'mean': statistics.fmean(runs),
+        'stdev': statistics.stdev(runs) if len(runs) > 1 else 0.,
+        'runs': runs,
+    }
+
+
+def compare(baseline: dict, results: dict, threshold: float,
+            min_delta: float) -> list[tuple[str, str, float, float]]:
+    """Lists every (day, phase, old median, new median) whose median got slower
+    than the baseline by more than `threshold` and `min_delta`.
+    """
+    regressions = []
+    for day, timings in results['days'].items():
+        for phase, stats in timings.items():
+            if (old := baseline['days'].get(day, {}).get(phase)) is None:
+                continue
+            old, new = old['median'], stats['median']
+            if new > old * (1 + threshold) and new - old > min_delta:
+                regressions.append((day, phase, old, new))
+    return regressions
+
+
+if __name__ == '__main__':
+    program()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Keeps every day module imported in a pool of worker processes behind a
+UNIX domain socket, so that solving an input costs no interpreter startup
+nor imports.
+
+Each request is a JSON header line `{"day": N, "size": S}` followed by S bytes
+of puzzle input; the reply is one JSON line with the answers, the timings and
+the error, if any. A connection may send any number of requests.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import click
+
+from helpers.registry import available_days
+from runner import preload, solve_text
+
+SOCKET_PATH = os.environ.get(
+    'AOC_SOCKET',
+    os.path.join(os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir()),
+                 f'aoc2023-python-{os.getuid()}.sock'),
+)
+
+# Puzzle inputs are a few tens of kilobytes; larger requests are refused.
+MAX_INPUT_SIZE = 64 * 1024 * 1024
+
+
+@click.group()
+def program():
+    """Solver daemon and its client.
+    """
+
+
+@program.command()
+@click.option('--socket', 'socket_path', default=SOCKET_PATH, show_default=True,
+              type=click.Path(dir_okay=False), help="UNIX socket to listen on.")
+@click.option('-j', '--jobs', default=os.cpu_count() or 1, show_default=True,
+              type=click.IntRange(1), help="Number of worker processes.")
+@click.option('--no-cache', is_flag=True, help="Do not use the on-disk caches.")
+def serve(socket_path, jobs, no_cache):
+    """Preloads every day and serves requests until interrupted.
+    """
+    try:
+        asyncio.run(Server(socket_path, jobs, not no_cache).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+@program.command()
+@click.argument('day', type=click.IntRange(1, 25))
+@click.argument('input_file', type=click.File('rb'), default='-')
+@click.option('--socket', 'socket_path', default=SOCKET_PATH, show_default=True,
+              type=click.Path(dir_okay=False), help="UNIX socket of the daemon.")
+def solve(day, input_file, socket_path):
+    """Solves DAY on INPUT_FILE (stdin by default) through the daemon.
+    """
+    reply = asyncio.run(request(socket_path, day, input_file.read()))
+    if reply['error']:
+        click.echo(f"Error: {reply['error']}", err=True)
+        sys.exit(1)
+    for part, answer in enumerate(reply['answers'], 1):
+        if answer is not None:
+            click.echo(f"Part {part}: {answer}")
+
+
+class Server:
+    """Reads requests from each connection and runs them in the process pool,
+    so that requests from many connections are solved concurrently.
+    """
+
+    def __init__(self, socket_path: str, jobs: int, use_cache: bool = True):
+        self.socket_path = socket_path
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.days = available_days()
+        self.executor = self.new_executor()
+
+    def new_executor(self) -> ProcessPoolExecutor:
+        # Workers are forked from a server process started with the first
+        # pool, before any connection is accepted, so that a pool replaced
+        # while serving does not inherit the open client sockets.
+        return ProcessPoolExecutor(
+            max_workers=self.jobs, mp_context=multiprocessing.get_context('forkserver'),
+            initializer=preload, initargs=(self.days, self.use_cache),
+        )
+
+    async def serve(self) -> None:
+        # Start every worker now rather than on the first requests.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self.executor, preload, [])
+            for _ in range(self.jobs)
+        ))
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+        click.echo(f"Listening on {self.socket_path}", err=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while header := await reader.readline():
+                try:
+                    header = json.loads(header)
+                    day, size = int(header['day']), int(header['size'])
+                    if not 0 <= size <= MAX_INPUT_SIZE:
+                        raise ValueError(f"size must be between 0 and {MAX_INPUT_SIZE}, got {size}")
+                except (ValueError, KeyError, TypeError) as exc:
+                    reply = {'answers': [], 'error': f"Bad request header: {exc}"}
+                    writer.write(json.dumps(reply).encode() + b'\n')
+                    break
+
+                try:
+                    data = await reader.readexactly(size)
+                except asyncio.IncompleteReadError as exc:
+                    reply = {'day': day, 'answers': [],
+                             'error': f"Truncated input: {len(exc.partial)} of {size} bytes"}
+                    writer.write(json.dumps(reply).encode() + b'\n')
+                    break
+
+                # Days without a bytes parser decode the input in the worker,
+                # so that invalid UTF-8 is reported like any other error.
+                if day in self.days:
+                    executor = self.executor
+                    try:
+                        result = await loop.run_in_executor(executor, solve_text, day, data)
+                        reply = result.to_json()
+                    except BrokenProcessPool:
+                        # A worker died, e.g. killed or out of memory: the pool
+                        # cannot be used anymore, so later requests get a new one.
+                        if self.executor is executor:
+                            self.executor = self.new_executor()
+                            executor.shutdown(wait=False)
+                        reply = {'day': day, 'answers': [], 'error': "A worker process died"}
+                else:
+                    reply = {'day': day, 'answers': [], 'error': f"No solution for day {day}"}
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def request(socket_path: str, day: int, data: bytes) -> dict:
+    """Sends one request to the daemon and returns its reply.
+    """
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(json.dumps({'day': day, 'size': len(data)}).encode() + b'\n' + data)
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+
+
+if __name__ == '__main__':
+    program()
@@ -5,30 +5,23 @@ https://adventofcode.com/2023/day/1
 from __future__ import annotations
 
 import dataclasses
+from collections import deque
 from enum import StrEnum
-from functools import cached_property
-from typing import TextIO, Self
+from typing import TextIO, Iterable, Self
 
-import more_itertools
-
-from helpers.cli import command_with_input_file, open_input_file
+from helpers.cli import command_with_input_file, iter_lines, open_input_bytes
+from helpers.registry import register
 
 
 @command_with_input_file
-def program(input_file: str) -> None:
+def program(input_file, stream=False):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        document = read_input(fobj)
-
-    # Part 1: find the sum of all of the calibration values.
-    p1_calibration_values = sum(line.fst_calibration_value for line in document)
-    print("Part 1:", p1_calibration_values)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = calibration_sums(data) if stream else solve(data)
 
-    # Part 2: find the sum of all of the calibration values.
-    #         (somes of digits are spelled out with letters)
-    p2_calibration_values = sum(line.snd_calibration_value for line in document)
-    print("Part 2:", p2_calibration_values)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
 
 def read_input(fobj: TextIO) -> list[Line]:
@@ -36,38 +29,159 @@ def read_input(fobj: TextIO) -> list[Line]:
     """
     return [Line.from_str(line) for line in fobj]
 
+
+def read_bytes(data: bytes) -> list[Line]:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return [Line(line) for line in map(bytes.strip, iter_lines(data))]
+
 LETTERS = (
     "zero", "one", "two", "three", "four", 
     "five", "six", "seven", "eight", "nine", 
     "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"
 )
 
-@dataclasses.dataclass(frozen=True)
+
+class Scanner:
+    """Aho-Corasick automaton over bytes, compiled into a dense transition
+    table, that finds the value of the first pattern in a line in one
+    forward pass and of the last one in one backward pass.
+
+    The first match to end is also the first to start, and likewise backwards,
+    as long as no pattern contains another one, which holds for digits and
+    digit names.
+    """
+
+    def __init__(self, patterns: dict[bytes, int]):
+        self.forward = self._compile(patterns)
+        self.backward = self._compile({word[::-1]: value for word, value in patterns.items()})
+
+    @staticmethod
+    def _compile(patterns: dict[bytes, int]) -> tuple[list[int], list[int]]:
+        """Returns the transition table, indexed by `state << 8 | byte`, and
+        the value matched on entering each state (-1 for none).
+        """
+        trie, values = [{}], [-1]
+        for word, value in patterns.items():
+            state = 0
+            for byte in word:
+                if byte not in trie[state]:
+                    trie[state][byte] = len(trie)
+                    trie.append({})
+                    values.append(-1)
+                state = trie[state][byte]
+            values[state] = value
+
+        # Breadth-first, so that the failure state of a state, being
+        # shallower, has its transitions filled in before it.
+        table = [0] * (len(trie) << 8)
+        fail = [0] * len(trie)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            if values[state] < 0:
+                values[state] = values[fail[state]]
+            # Bytes without a child go where the failure state goes.
+            row, fail_row = state << 8, fail[state] << 8
+            if state:
+                table[row:row + 256] = table[fail_row:fail_row + 256]
+            for byte, child in trie[state].items():
+                fail[child] = table[fail_row | byte] if state else 0
+                table[row | byte] = child
+                queue.append(child)
+        return table, values
+
+    def first(self, line: bytes, default: int = -1) -> int:
+        table, values = self.forward
+        state = 0
+        for byte in line:
+            state = table[state << 8 | byte]
+            if (value := values[state]) >= 0:
+                return value
+        return default
+
+    def last(self, line: bytes, default: int = -1) -> int:
+        table, values = self.backward
+        state = 0
+        for byte in reversed(line):
+            state = table[state << 8 | byte]
+            if (value := values[state]) >= 0:
+                return value
+        return default
+
+
+DIGITS = Scanner({letter.encode(): idx % 10 for idx, letter in enumerate(LETTERS[10:])})
+DIGITS_AND_NAMES = Scanner({letter.encode(): idx % 10 for idx, letter in enumerate(LETTERS)})
+
+
+def fst_calibration_value(line: bytes) -> int:
+    """Joins the first and last digits, or gives 0 when there is none.
+    """
+    first_digit = DIGITS.first(line, 0)
+    return first_digit*10 + DIGITS.last(line, first_digit)
+
+
+def snd_calibration_value(line: bytes) -> int:
+    """Joins the first and last digits or digit names.
+    """
+    if (first_digit := DIGITS_AND_NAMES.first(line)) < 0:
+        raise ValueError(f"No digit in line {bytes(line)!r}")
+    return first_digit*10 + DIGITS_AND_NAMES.last(line)
+
+
+def calibration_sums(source) -> tuple[int, int]:
+    """Solves both parts on a whole document at once, from a buffer such as
+    a mapped file or from a binary stream (see `helpers.cli.iter_lines()`).
+    Each line is only scanned up to its first and from its last digit, so
+    the cost grows linearly with the number of lines.
+    """
+    p1 = p2 = 0
+    for line in iter_lines(source):
+        if line := line.strip():
+            p1 += fst_calibration_value(line)
+            p2 += snd_calibration_value(line)
+    return p1, p2
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Line:
-    text: str
+    text: bytes
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        return cls(text=s.strip())
+        return cls(text=s.strip().encode())
 
-    @cached_property
+    @property
     def fst_calibration_value(self) -> int:
-        digits = more_itertools.map_except(int, self.text, ValueError)
-        first_digit = more_itertools.first(digits, 0)
-        last_digit = more_itertools.last(digits, first_digit) 
-        return first_digit*10 + last_digit
+        return fst_calibration_value(self.text)
    
-    @cached_property
+    @property
     def snd_calibration_value(self) -> int:
-        candidates = []
-        for idx, letter in enumerate(LETTERS):
-            if (pos:=self.text.find(letter)) != -1:
-                candidates.append((pos, idx%10))
+        return snd_calibration_value(self.text)
+
+
+def p1_solve(document: list[Line]) -> int:
+    """Finds the sum of all of the calibration values.
+    """
+    return sum(line.fst_calibration_value for line in document)
+
+
+def p2_solve(document: list[Line]) -> int:
+    """Finds the sum of all of the calibration values
+    (some of digits are spelled out with letters).
+    """
+    return sum(line.snd_calibration_value for line in document)
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines, in constant memory.
+    """
+    return calibration_sums(line.encode() for line in lines)
+
 
-                rpos = self.text.rfind(letter)
-                candidates.append((rpos, idx%10))
+SOLUTION = register(1, read_input, p1_solve, p2_solve, solve_stream, read_bytes)
+solve = SOLUTION.solve
 
-        return min(candidates)[1]*10 + max(candidates)[1]
 
 if __name__ == '__main__':
     program()
@@ -4,37 +4,118 @@ https://adventofcode.com/2023/day/2
 """
 from __future__ import annotations
 
-from typing import TextIO
+from functools import cached_property
+from typing import TYPE_CHECKING, TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
-from functools import cached_property
 import math
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        games = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-    # Part 1: find the sum of ids of possible game. 
-    p1 = sum(game.id for game in games if game.is_possible)
     print("Part 1:", p1)
-
-    # Part 2: find the sum of the power of game sets
-    p2 = sum(game.power for game in games)
     print("Part 2:", p2)
 
 
-def read_input(fobj: TextIO) -> list[Game]:
+def read_input(fobj: TextIO) -> Games:
     """Reads and parses input file according to problem statement.
     """
-    return [Game.from_str(record) for record in fobj]
+    return Games.from_bytes(fobj.read().encode())
+
+
+# The bag of part 1, as (red, green, blue) counts.
+LIMITS = (12, 13, 14)
 
 
 @dataclasses.dataclass(frozen=True)
+class Games:
+    """Every draw of every game as NumPy columns: `ids[g]` is the id of game
+    `g`, and draw `d` of game `draw_game[d]` took `draws[d]` (red, green, blue)
+    cubes. Draws of a game are contiguous.
+    """
+    ids: np.ndarray
+    draw_game: np.ndarray
+    draws: np.ndarray
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Tokenizes the whole record at once: numbers are the runs of
+        digits, game ids are followed by ':' and cube counts by a space and
+        the initial of their color, and each ':' or ';' starts a draw.
+        """
+        import numpy as np
+
+        text = np.frombuffer(data, dtype=np.uint8)
+        is_digit = (text >= ord('0')) & (text <= ord('9'))
+        edges = np.flatnonzero(np.diff(is_digit.astype(np.int8), prepend=0, append=0))
+        starts, stops = edges[::2], edges[1::2]
+
+        # Each digit weighted by its power of ten, summed per number.
+        digits = np.flatnonzero(is_digit)
+        lengths = stops - starts
+        number = np.repeat(np.arange(len(starts)), lengths)
+        terms = (text[digits] - ord('0')).astype(np.int64) * np.power(10, stops[number] - 1 - digits)
+        values = np.add.reduceat(terms, np.cumsum(lengths) - lengths) if len(terms) else terms
+
+        is_id = text[np.minimum(stops, len(text) - 1)] == ord(':')
+        counts, count_starts = values[~is_id], starts[~is_id]
+        colors = np.frombuffer(COLOR_INDEX, dtype=np.uint8)[text[stops[~is_id] + 1]]
+
+        separators = np.flatnonzero((text == ord(':')) | (text == ord(';')))
+        draws = np.zeros((len(separators), 3), dtype=np.int64)
+        draws[np.searchsorted(separators, count_starts) - 1, colors] = counts
+        draw_game = np.cumsum(text[separators] == ord(':')) - 1
+        return cls(ids=values[is_id], draw_game=draw_game, draws=draws)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @cached_property
+    def maxima(self) -> np.ndarray:
+        """The most cubes of each color shown in each game, one row per game.
+        """
+        import numpy as np
+
+        if not len(self.draws):
+            return np.zeros((0, 3), dtype=np.int64)
+        firsts = np.flatnonzero(np.diff(self.draw_game, prepend=-1))
+        return np.maximum.reduceat(self.draws, firsts, axis=0)
+
+    def possible(self, limits=LIMITS) -> np.ndarray:
+        """Tells which games the bag `limits` allows. `limits` may also be
+        a (scenarios, 3) array, giving one row of answers per scenario.
+        """
+        import numpy as np
+
+        return (self.maxima <= np.asarray(limits)[..., None, :]).all(axis=-1)
+
+    def id_sums(self, limits=LIMITS) -> int | np.ndarray:
+        """Sums the ids of the possible games, for each scenario of limits.
+        """
+        total = self.possible(limits) @ self.ids
+        return total if total.ndim else int(total)
+
+    def powers(self) -> np.ndarray:
+        return self.maxima.prod(axis=1)
+
+
+# Column of each color by its initial.
+COLOR_INDEX = bytes(1 if byte == ord('g') else 2 if byte == ord('b') else 0 for byte in range(256))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Game:
+    """One game parsed from its line, for streaming.
+    """
     id: int
     bag: list[Cubes]
 
@@ -48,16 +129,15 @@ class Game:
             bag=[Cubes.from_str(subset) for subset in subsets]
         )
 
-    @cached_property
-    def is_possible(self) -> bool:
-        return all(self.bag)
+    def is_possible(self, limits=LIMITS) -> bool:
+        return all(cubes.fits(limits) for cubes in self.bag)
 
-    @cached_property
+    @property
     def power(self) -> int:
         return math.prod(map(max, zip(*self.bag)))
    
 
-@dataclasses.dataclass(frozen=True, order=True)
+@dataclasses.dataclass(frozen=True, order=True, slots=True)
 class Cubes:
     red: int = 0
     green: int = 0
@@ -71,11 +151,38 @@ class Cubes:
             cubes[color] = int(value)
         return cls(**cubes)
 
-    def __bool__(self):
-        return self.red <= 12 and self.green <= 13 and self.blue <= 14
+    def fits(self, limits=LIMITS) -> bool:
+        red, green, blue = limits
+        return self.red <= red and self.green <= green and self.blue <= blue
 
     def __iter__(self):
-        yield from (self.red, self.green, self.blue) 
+        yield from (self.red, self.green, self.blue)
+
+
+def p1_solve(games: Games) -> int:
+    """Finds the sum of ids of possible games.
+    """
+    return games.id_sums()
+
+
+def p2_solve(games: Games) -> int:
+    """Finds the sum of the power of game sets.
+    """
+    return int(games.powers().sum())
+
+
+def solve_stream(records: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the records, in constant memory.
+    """
+    p1 = p2 = 0
+    for game in map(Game.from_str, records):
+        p1 += game.id if game.is_possible() else 0
+        p2 += game.power
+    return p1, p2
+
+
+SOLUTION = register(2, read_input, p1_solve, p2_solve, solve_stream)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
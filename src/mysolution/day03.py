@@ -1,26 +1,25 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import TextIO, Iterable
+from typing import TextIO, Iterable, Iterator, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
-from itertools import product
+from bisect import bisect_left, bisect_right
+import itertools
 import re
 import math
 
 
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        engine_schematic = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-    # Part 1: find the sum of 
-    p1 = sum(sum(parts)for parts in engine_schematic.gears)
     print("Part 1:", p1)
-
-    p2 = sum(math.prod(parts) for parts in engine_schematic.gears if len(parts) == 2)
     print("Part 2:", p2)
 
 
@@ -30,30 +29,122 @@ def read_input(fobj: TextIO) -> EngineSchematic:
     return EngineSchematic.from_str(fobj.read())
 
 
+NUMBER = re.compile(r'\d+')
+SYMBOL = re.compile(r'[^.\d]')
+
+
 @dataclasses.dataclass
 class EngineSchematic:
     gears: Iterable[list[int]]
 
     @classmethod
     def from_str(cls, s: str) -> Self: 
-        schematic = [line.strip() for line in s.strip().splitlines()]
-
-        gears = {
-            (row, col): []
-            for row, text in enumerate(schematic)
-            for col, char in enumerate(text)
-            if char not in '.0123456789'
-        }
-
-        for row, text in enumerate(schematic):
-            for col in re.finditer(r'\d+', text):
-                rows = range(row-1, row+2)
-                cols = range(col.start()-1, col.end()+1)
-                for pos in product(rows, cols):
-                    if pos in gears.keys():
-                        gears[pos].append(int(col.group()))
-
-        return cls(gears=gears.values())
+        return cls(gears=list(symbol_parts(s.strip().splitlines())))
+
+
+@dataclasses.dataclass(slots=True)
+class Row:
+    """A row of the schematic with the columns of its symbols, in increasing
+    order, and the part numbers attached to each symbol so far.
+    """
+    text: str
+    cols: list[int]
+    parts: list[list[int]]
+
+    @classmethod
+    def from_str(cls, s: str) -> Self:
+        text = s.strip()
+        cols = [match.start() for match in SYMBOL.finditer(text)]
+        return cls(text=text, cols=cols, parts=[[] for _ in cols])
+
+
+def symbol_parts(lines: Iterable[str]) -> Iterator[list[int]]:
+    """Yields the numbers adjacent to each symbol, row by row, while holding
+    only three rows: the numbers of a row are attached to the symbols of the
+    rows above, beside and below it once the row below arrives, which also
+    completes the symbols of the row above.
+    """
+    empty = Row('', [], [])
+    prev, cur = empty, empty
+    for nxt in itertools.chain(map(Row.from_str, lines), (empty, empty)):
+        for match in NUMBER.finditer(cur.text):
+            number = int(match.group())
+            for row in (prev, cur, nxt):
+                lo = bisect_left(row.cols, match.start() - 1)
+                hi = bisect_right(row.cols, match.end())
+                for parts in row.parts[lo:hi]:
+                    parts.append(number)
+        yield from prev.parts
+        prev, cur = cur, nxt
+
+
+def solve_array(text: str) -> tuple[int, int]:
+    """Solves both parts with NumPy: the 3x3 dilation of the symbol mask
+    selects the digits touching a symbol, and the (number, symbol) pairs
+    found around those digits are reduced per symbol.
+    """
+    import numpy as np
+
+    grid = Grid.from_str(text).padded(b'.')
+    cells, w = np.frombuffer(grid.cells, dtype=np.uint8), grid.ncol
+    is_digit = (cells >= ord('0')) & (cells <= ord('9'))
+    is_symbol = ~is_digit & (cells != ord('.'))
+    offsets = [dr * w + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+    # Numbers are the runs of digits in the flat array, since the padding
+    # keeps runs from wrapping around rows.
+    is_start = is_digit & ~np.roll(is_digit, 1)
+    starts = np.flatnonzero(is_start)
+    stops = np.flatnonzero(is_digit & ~np.roll(is_digit, -1)) + 1
+    number = np.cumsum(is_start) - 1
+    digits = np.flatnonzero(is_digit)
+    terms = (cells[digits] - ord('0')).astype(np.int64) * np.power(10, stops[number[digits]] - 1 - digits)
+    values = np.add.reduceat(terms, np.cumsum(stops - starts) - (stops - starts)) if len(terms) else terms
+
+    dilated = np.zeros_like(is_symbol)
+    inner = slice(w + 1, len(cells) - w - 1)
+    for offset in offsets:
+        dilated[inner] |= is_symbol[inner.start + offset:inner.stop + offset]
+    touching = digits[dilated[digits]]
+
+    # Pairs packed as `symbol << 32 | number`, sorted by symbol.
+    symbol = np.cumsum(is_symbol) - 1
+    pairs = []
+    for offset in offsets:
+        neighbors = touching + offset
+        hit = is_symbol[neighbors]
+        pairs.append(symbol[neighbors[hit]] << 32 | number[touching[hit]])
+    pairs = np.unique(np.concatenate(pairs))
+    symbols, numbers = pairs >> 32, values[pairs & 0xFFFFFFFF]
+
+    p1 = int(numbers.sum())
+    firsts = np.flatnonzero(np.diff(symbols, prepend=-1))
+    counts = np.diff(firsts, append=len(pairs))
+    p2 = int(np.multiply.reduceat(numbers, firsts)[counts == 2].sum()) if len(pairs) else 0
+    return p1, p2
+
+
+def p1_solve(engine_schematic: EngineSchematic) -> int:
+    return sum(sum(parts) for parts in engine_schematic.gears)
+
+
+def p2_solve(engine_schematic: EngineSchematic) -> int:
+    return sum(math.prod(parts) for parts in engine_schematic.gears if len(parts) == 2)
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines, holding three rows.
+    """
+    p1 = p2 = 0
+    for parts in symbol_parts(lines):
+        p1 += sum(parts)
+        if len(parts) == 2:
+            p2 += parts[0] * parts[1]
+    return p1, p2
+
+
+SOLUTION = register(3, read_input, p1_solve, p2_solve, solve_stream)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -4,25 +4,23 @@ https://adventofcode.com/2023/day/4
 """
 from __future__ import annotations
 
-from typing import TextIO
+from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
-from functools import cached_property
+from collections import deque
+import functools
+import operator
 
 
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        cards = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-    # Part 1: find the total points
-    p1 = sum(card.points for card in cards)
     print("Part 1:", p1)
-
-    # Part 2: find the total scratchcards
-    p2 = total_scratchcards(cards)
     print("Part 2:", p2)
 
 
@@ -32,32 +30,76 @@ def read_input(fobj: TextIO) -> list[ScratchCard]:
     return [ScratchCard.from_str(line) for line in fobj]
 
 
-@dataclasses.dataclass(frozen=True)
+# The bit of each number, looked up by its text rather than parsed.
+BITS = {str(n): 1 << n for n in range(100)}
+
+
+def bitset(numbers: str) -> int:
+    """Encodes a list of numbers, all in 0..99, as the bits of an int.
+    """
+    return functools.reduce(operator.or_, map(BITS.__getitem__, numbers.split()), 0)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ScratchCard:
-    win: set[str]
+    matches: int
 
     @classmethod
     def from_str(cls, s: str) -> Self:
         card, numbers = s.strip().split(':')
-        winning, having = numbers.strip().split('|')
-        winning_numbers = set(winning.strip().split())
-        having_numbers = set(having.strip().split())
+        winning, having = numbers.split('|')
         return cls(
-            win=winning_numbers & having_numbers
+            matches=(bitset(winning) & bitset(having)).bit_count()
         )
 
-    @cached_property
+    @property
     def points(self) -> int:
-        n = len(self.win)
-        return 2**(n-1) if n else 0
+        n = self.matches
+        return 1 << (n-1) if n else 0
 
 
 def total_scratchcards(cards: list[ScratchCard]) -> int:
-    instances = [1]*len(cards)
+    """Counts the cards with their copies. Card i adds its instances to the
+    cards i+1 .. i+matches, recorded as two entries of a difference array.
+    """
+    diff = [0]*(len(cards)+1)
+    total = running = 0
     for i, card in enumerate(cards):
-        for j in range(1, len(card.win)+1):
-            instances[i+j] += instances[i] 
-    return sum(instances)
+        running += diff[i]
+        instances = 1 + running
+        total += instances
+        diff[i+1] += instances
+        diff[min(i+1+card.matches, len(cards))] -= instances
+    return total
+
+
+def p1_solve(cards: list[ScratchCard]) -> int:
+    """Finds the total points.
+    """
+    return sum(card.points for card in cards)
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines. A card only wins copies of
+    the next few cards, so the difference array only needs to look ahead
+    one card more than the most matches so far.
+    """
+    p1 = p2 = running = 0
+    ahead = deque()  # the difference array from the current card on
+    for card in map(ScratchCard.from_str, lines):
+        running += ahead.popleft() if ahead else 0
+        instances = 1 + running
+        p1 += card.points
+        p2 += instances
+
+        ahead.extend([0] * (card.matches + 1 - len(ahead)))
+        ahead[0] += instances
+        ahead[card.matches] -= instances
+    return p1, p2
+
+
+SOLUTION = register(4, read_input, p1_solve, total_scratchcards, solve_stream)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -4,9 +4,12 @@ https://adventofcode.com/2023/day/5
 """
 from __future__ import annotations
 
-from typing import TextIO
+from typing import TextIO, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.intervals import IntervalSet, PiecewiseMap
+from helpers.registry import register
 import dataclasses
+import functools
 from functools import cached_property
 import itertools
 import more_itertools
@@ -18,13 +21,9 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        almanac = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    # Part 1: find the sum of 
-    p1 = almanac.p1_solve()
     print("Part 1:", p1)
-
-    p2 = almanac.p2_solve()
     print("Part 2:", p2)
 
 
@@ -37,7 +36,7 @@ def read_input(fobj: TextIO) -> list[Game]:
 @dataclasses.dataclass
 class Almanac:
     seeds: list[int]
-    maps: list[list[tuple[int, int, int]]]
+    maps: list[PiecewiseMap]
 
     @classmethod
     def from_str(cls, s: str) -> Self:
@@ -47,11 +46,10 @@ class Almanac:
         maps = []
         for idx, line in enumerate(lines):
             ranges = more_itertools.map_except(int, line.split(), ValueError)
-            mp = []
-            for dst, src, length in more_itertools.batched(ranges, 3):
-                mp.append((src, src+length, dst - src))
-
-            maps.append(mp)
+            maps.append(PiecewiseMap.from_ranges(
+                (src, src+length, dst - src)
+                for dst, src, length in more_itertools.batched(ranges, 3)
+            ))
 
         return cls(
             seeds=seeds,
@@ -59,40 +57,31 @@ class Almanac:
         )
 
 
+    @cached_property
+    def location(self) -> PiecewiseMap:
+        """The seed to location map, composed once from all the maps.
+        """
+        return functools.reduce(PiecewiseMap.then, self.maps, PiecewiseMap())
+
+    def lowest_location(self, seeds) -> int:
+        """Finds the lowest location of a list or NumPy array of seeds.
+        """
+        if hasattr(seeds, 'dtype'):
+            return int(self.location.map_array(seeds).min())
+        return min(self.location.map_many(seeds))
+
     def p1_solve(self):
-        ans = []
-        for seed in self.seeds:
-            for ranges in self.maps:
-                for start, end, val in ranges:
-                    if start <= seed < end:
-                        seed += val
-                        break
-            ans.append(seed)
-        return min(ans)
-                    
+        return self.lowest_location(self.seeds)
 
     def p2_solve(self):
-        seeds = list((seed, seed+length) for seed, length in more_itertools.chunked(self.seeds, 2))
-        for ranges in self.maps:
-            new_seeds = []
-            while seeds:
-                seed_start, seed_end = seeds.pop()
-                for range_start, range_end, val in ranges:
-                    start = max(seed_start, range_start)
-                    end = min(seed_end, range_end)
-                    if start < end:
-                        new_seeds.append((start + val, end + val))
-                        if start > seed_start:
-                            seeds.append((seed_start, start))
-                        if seed_end > end:
-                            seeds.append((end, seed_end))
-                        break
-                else:
-                    # not overlapped
-                    new_seeds.append((seed_start, seed_end))
-            seeds = new_seeds
-        return min(seeds)[0]
+        seeds = IntervalSet.from_intervals(
+            (seed, seed+length) for seed, length in more_itertools.chunked(self.seeds, 2)
+        )
+        return self.location.min_image(seeds)
+
 
+SOLUTION = register(5, read_input, Almanac.p1_solve, Almanac.p2_solve)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -6,8 +6,8 @@ from __future__ import annotations
 
 from typing import TextIO
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
-import more_itertools
 from bisect import bisect_right
 
 
@@ -16,14 +16,9 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        record = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    # Part 1: find the number of ways that could beat the record in each race.
-    p1 = beating_ways(record.races)
     print("Part 1:", p1)
-
-    # Part 1: find the number of ways that could beat the record in one much longer race.
-    p2 = beating_ways(record.longer_races)
     print("Part 2:", p2)
 
 
@@ -42,8 +37,8 @@ class Record:
     def from_str(cls, s: str) -> Self:
         time_records, dist_records = s.strip().splitlines()
         races = tuple(zip(
-            more_itertools.map_except(int, time_records.split(), ValueError),
-            more_itertools.map_except(int, dist_records.split(), ValueError)
+            map(int, time_records.split()[1:]),
+            map(int, dist_records.split()[1:])
         ))
         longer_races = ((
             int("".join(t for t in time_records if t.isdigit())),
@@ -63,6 +58,22 @@ def beating_ways(races: tuple[tuple[int, int]]) -> int:
     return ways
 
 
+def p1_solve(record: Record) -> int:
+    """Finds the number of ways that could beat the record in each race.
+    """
+    return beating_ways(record.races)
+
+
+def p2_solve(record: Record) -> int:
+    """Finds the number of ways that could beat the record in one much longer race.
+    """
+    return beating_ways(record.longer_races)
+
+
+SOLUTION = register(6, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 from collections import Counter
@@ -17,14 +18,10 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        hands = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    fst_ranked_hands = sorted(get_hand(cards, cards, bid) for cards, bid in hands)
-    print("Part 1:", total_winnings(fst_ranked_hands))
-
-    snd_ranked_hands = sorted(get_hand(cards.replace('J', ''), 
-                                       cards.replace('J', '?'), bid) for cards, bid in hands)
-    print("Part 2:", total_winnings(snd_ranked_hands))
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
 
 def read_input(fobj: TextIO) -> list[list[str]]:
@@ -87,7 +84,7 @@ class Label(IntEnum):
                 return Label.FIVE_OF_A_KIND
 
 
-@dataclasses.dataclass(order=True, frozen=True)
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
 class Hand:
     label: Label
     cards: tuple[Card]
@@ -103,7 +100,22 @@ def get_hand(label_cards: str, cards: str, bid: str) -> Hand:
 
 def total_winnings(ranked_hands: list[Hand]) -> int:
     return sum(hand.bid * (rank+1) for rank, hand in enumerate(ranked_hands))
-    
+
+
+def p1_solve(hands: list[list[str]]) -> int:
+    ranked_hands = sorted(get_hand(cards, cards, bid) for cards, bid in hands)
+    return total_winnings(ranked_hands)
+
+
+def p2_solve(hands: list[list[str]]) -> int:
+    ranked_hands = sorted(get_hand(cards.replace('J', ''),
+                                   cards.replace('J', '?'), bid) for cards, bid in hands)
+    return total_winnings(ranked_hands)
+
+
+SOLUTION = register(7, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -6,10 +6,12 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.cycles import event_times, first_common_time
+from helpers.graph import Graph
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
-import math
 
         
 @command_with_input_file
@@ -17,14 +19,9 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        instructions, network = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    p1 = lookup(network, instructions, "AAA")
     print("Part 1:", p1)
-
-    start_nodes = [node for node in network.nodes.keys() if node.endswith('A')]
-    steps = (lookup(network, instructions, node) for node in start_nodes)
-    p2 = math.lcm(*steps)
     print("Part 2:", p2)
 
 
@@ -37,34 +34,75 @@ def read_input(fobj: TextIO):
 
 @dataclasses.dataclass
 class Network:
-    nodes: dict[Node, dict[str, Node]]
+    graph: Graph
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        nodes = {}
+        edges = []
         for line in s:
             match line.strip().split():
                 case [name, '=', left, right]:
-                    nodes[name] = {'L': left.strip('(,'),
-                                   'R': right.strip(')')}
+                    edges.append((name, left.strip('(,')))
+                    edges.append((name, right.strip(')')))
 
-        return cls(nodes=nodes)
+        # Every node has its left then its right edge.
+        return cls(graph=Graph.from_edges(edges, nodes=[u for u, _ in edges[::2]]))
    
 
 def lookup(network: Network, instructions: str, node: str) -> int:
-    if node not in network.nodes:
+    graph = network.graph
+    if node not in graph.ids:
         return 0
 
-    it = itertools.cycle(instructions)
+    offsets, targets = graph.offsets, graph.targets
+    is_end = [name.endswith('Z') for name in graph.names]
+    it = itertools.cycle([instruction == 'R' for instruction in instructions])
+    node = graph.ids[node]
     steps = 0 
-    while not node.endswith('Z'):
-        instruction = next(it)
-        node = network.nodes[node][instruction]
+    while not is_end[node]:
+        node = targets[offsets[node] + next(it)]
         steps += 1
 
     return steps
 
 
+def p1_solve(puzzle: tuple[str, Network]) -> int:
+    instructions, network = puzzle
+    return lookup(network, instructions, "AAA")
+
+
+class Walk:
+    """The walk from a node, whose state (node, position in the
+    instructions) is packed into one int.
+    """
+
+    def __init__(self, network: Network, instructions: str, node: str):
+        graph, self.n = network.graph, len(instructions)
+        self.offsets, self.targets = graph.offsets, graph.targets
+        self.is_end = [name.endswith('Z') for name in graph.names]
+        self.bits = [instruction == 'R' for instruction in instructions]
+        self.start = graph.ids[node] * self.n
+
+    def step(self, state: int) -> int:
+        node, i = divmod(state, self.n)
+        return self.targets[self.offsets[node] + self.bits[i]] * self.n + (i + 1) % self.n
+
+    def at_end(self, state: int) -> bool:
+        return self.is_end[state // self.n]
+
+
+def p2_solve(puzzle: tuple[str, Network]) -> int:
+    instructions, network = puzzle
+    start_nodes = [node for node in network.graph.names if node.endswith('A')]
+    walks = [Walk(network, instructions, node) for node in start_nodes]
+    # The walks need not cycle cleanly, e.g. reach an end node at other
+    # steps than multiples of their first one.
+    return first_common_time(event_times(walk.start, walk.step, walk.at_end) for walk in walks)
+
+
+SOLUTION = register(8, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -14,16 +15,13 @@ from functools import cached_property
 
         
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        report = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-    p1 = sum(history.fst_value for history in report)
     print("Part 1:", p1)
-
-    p2 = sum(history.snd_value for history in report)
     print("Part 2:", p2)
 
 
@@ -60,7 +58,29 @@ class History:
             value += differences[0] * factor
             factor *= -1
         return value
-     
+
+
+def p1_solve(report: list[History]) -> int:
+    return sum(history.fst_value for history in report)
+
+
+def p2_solve(report: list[History]) -> int:
+    return sum(history.snd_value for history in report)
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines, in constant memory.
+    """
+    p1 = p2 = 0
+    for history in map(History.from_str, lines):
+        p1 += history.fst_value
+        p2 += history.snd_value
+    return p1, p2
+
+
+SOLUTION = register(9, read_input, p1_solve, p2_solve, solve_stream)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
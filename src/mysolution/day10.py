@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers import geometry
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -17,104 +20,107 @@ from operator import sub
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        maze = read_input(fobj)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-    p1 = maze.bfs()
     print("Part 1:", p1)
-
-    polygon = maze.dfs()
-    p2 = int(area_by_shoelace(polygon) + 1 - len(polygon)/2)
     print("Part 2:", p2)
 
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return Maze.from_str(fobj.read())
 
 
-N = (-1, 0, ('|', 'F', '7'))
-S = ( 1, 0, ('|', 'L', 'J'))
-E = ( 0, 1, ('-', '7', 'J'))
-W = ( 0,-1, ('-', 'L', 'F'))
+def read_bytes(data: bytes) -> Maze:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Maze.from_bytes(data)
+
+
+N = (-1, 0, b'|F7')
+S = ( 1, 0, b'|LJ')
+E = ( 0, 1, b'-7J')
+W = ( 0,-1, b'-LF')
 
 DIRECTIONS = {
-    'S': [N, S, E, W],
-    '|': [N, S],
-    '-': [W, E],
-    'J': [N, W],
-    'L': [N, E],
-    '7': [S, W],
-    'F': [S, E],
+    ord('S'): [N, S, E, W],
+    ord('|'): [N, S],
+    ord('-'): [W, E],
+    ord('J'): [N, W],
+    ord('L'): [N, E],
+    ord('7'): [S, W],
+    ord('F'): [S, E],
 }
+VISITED = ord('X')
 
 
 @dataclasses.dataclass
 class Maze:
-    fst_grid: list[list[str]]
-    snd_grid: list[list[str]]
-    start: tuple[int, int] 
-    nrow: int
-    ncol: int
+    grid: Grid
+    start: int
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        fst_grid, snd_grid, start = [], [], None
-        for r, line in enumerate(s.strip().splitlines()):
-            row = []
-            for c, pipe in enumerate(line):
-                if pipe == 'S':
-                    start = (r, c)
-                row.append(pipe)
-            fst_grid.append(row[:])
-            snd_grid.append(row[:])
-        
-        nrow, ncol = len(fst_grid), len(fst_grid[0])
-        if start is None:
+        return cls.from_bytes(s.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        grid = Grid.from_bytes(data)
+        if (start := grid.cells.find(b'S')) == -1:
             raise ValueError("No starting position (S) from puzzle input.")
 
-        return cls(fst_grid=fst_grid, snd_grid=snd_grid, start=start, nrow=nrow, ncol=ncol)
+        return cls(grid=grid, start=start)
 
-    def neighbors(self, grid, x, y) -> Iterable[tuple[int, int] | None]:
-        if grid[x][y] == 'X':
+    def neighbors(self, cells, i) -> Iterable[int]:
+        if cells[i] == VISITED:
             return
 
-        for dx, dy, direction in DIRECTIONS[grid[x][y]]:
-            if (0 <= (pos_x := x + dx) < self.nrow and 
-                0 <= (pos_y := y + dy) < self.ncol and
-                grid[pos_x][pos_y] in direction):
-
-                yield (pos_x, pos_y)
+        for dr, dc, direction in DIRECTIONS.get(cells[i], ()):
+            if (j := self.grid.step(i, dr, dc)) is not None and cells[j] in direction:
+                yield j
 
     def bfs(self) -> int:
+        cells = bytearray(self.grid.cells)
         q = deque([(self.start, 0)])
         ans = 0
         while q:
-            (r, c), steps = q.popleft()
+            i, steps = q.popleft()
             ans = max(ans, steps)
-            for i, j in self.neighbors(self.fst_grid, r, c):
-                q.append(((i, j), steps+1))
-            self.fst_grid[r][c] = 'X'
+            for j in self.neighbors(cells, i):
+                q.append((j, steps+1))
+            cells[i] = VISITED
         return ans
 
 
     def dfs(self) -> list[tuple[int, int]]:
+        cells = bytearray(self.grid.cells)
         q = deque([self.start])
         polygon = []
         while q:
-            r, c = q.pop()
-            polygon.append((r, c))
-            for i, j in self.neighbors(self.snd_grid, r, c):
-                q.append((i, j))
-            self.snd_grid[r][c] = 'X'
+            i = q.pop()
+            polygon.append(self.grid.position(i))
+            for j in self.neighbors(cells, i):
+                q.append(j)
+            cells[i] = VISITED
         polygon.pop()
         return polygon
 
 
-def area_by_shoelace(polygon):
-    x, y = zip(*polygon)
-    return abs(sum(x[i-1]*y[i]-x[i]*y[i-1] for i in range(len(x)))) / 2.
-       
+def p1_solve(maze: Maze) -> int:
+    return maze.bfs()
+
+
+def p2_solve(maze: Maze) -> int:
+    polygon = maze.dfs()
+    # Every step of the loop moves to an adjacent tile, one boundary point each.
+    return geometry.interior_points(geometry.shoelace(*zip(*polygon)), len(polygon))
+
+
+SOLUTION = register(10, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
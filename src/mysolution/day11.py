@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -16,12 +17,9 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        universe = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    p1 = shortest_path(universe, expansion_factor=2)
     print("Part 1:", p1)
-
-    p2 = shortest_path(universe, expansion_factor=1000000)
     print("Part 2:", p2)
 
 
@@ -69,6 +67,18 @@ def shortest_path(universe: Unverse, expansion_factor: int) -> int:
     return ans
 
 
+def p1_solve(universe: Universe) -> int:
+    return shortest_path(universe, expansion_factor=2)
+
+
+def p2_solve(universe: Universe) -> int:
+    return shortest_path(universe, expansion_factor=1000000)
+
+
+SOLUTION = register(11, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
+from helpers import metrics
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -14,29 +16,21 @@ from collections import Counter, deque
 
         
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        springs = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-
-    p1 = 0
-    for spring in springs:
-        p1 += possible_ways(spring.records, spring.groups)
     print("Part 1:", p1)
-
-    p2 = 0
-    for spring in springs:
-        records = "?".join([spring.records]*5)
-        groups = spring.groups*5
-        p2 += possible_ways(records, groups)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
+    # A new puzzle starts a new run, e.g. every run of the benchmark.
+    possible_ways.cache_clear()
     return [Springs.from_str(line) for line in fobj]
 
 
@@ -67,6 +61,54 @@ def possible_ways(s: str, groups: tuple[int]):
     return ways
 
 
+def record_cache_info(hits: int, misses: int):
+    """Adds memo statistics of `possible_ways` to the metrics, once per run.
+    """
+    if metrics.ACTIVE is None:
+        return
+    metrics.count('day12_possible_ways_hits', hits)
+    metrics.count('day12_possible_ways_misses', misses)
+    counters = metrics.ACTIVE.counters
+    hits, misses = counters['day12_possible_ways_hits'], counters['day12_possible_ways_misses']
+    metrics.gauge('day12_possible_ways_hit_rate', hits / (hits + misses) if hits + misses else 0.0)
+
+
+def p1_solve(springs: list[Springs]) -> int:
+    # Part 2 then reuses the memo, whose suffixes part 1 already counted.
+    possible_ways.cache_clear()
+    return sum(possible_ways(spring.records, spring.groups) for spring in springs)
+
+
+def p2_solve(springs: list[Springs]) -> int:
+    p2 = 0
+    for spring in springs:
+        records = "?".join([spring.records]*5)
+        groups = spring.groups*5
+        p2 += possible_ways(records, groups)
+    info = possible_ways.cache_info()
+    record_cache_info(info.hits, info.misses)
+    return p2
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines, in constant memory: the
+    memo of `possible_ways` only lives for one line at a time.
+    """
+    p1 = p2 = hits = misses = 0
+    for spring in map(Springs.from_str, lines):
+        possible_ways.cache_clear()
+        p1 += possible_ways(spring.records, spring.groups)
+        p2 += possible_ways("?".join([spring.records]*5), spring.groups*5)
+        info = possible_ways.cache_info()
+        hits, misses = hits + info.hits, misses + info.misses
+    possible_ways.cache_clear()
+    record_cache_info(hits, misses)
+    return p1, p2
+
+
+SOLUTION = register(12, read_input, p1_solve, p2_solve, solve_stream)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers.cli import command_with_input_file, iter_records, open_input_bytes
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -14,13 +15,10 @@ from functools import cached_property
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        patterns = read_input(fobj)
-    
-    p1 = sum(reflection(pattern, penalty=0) for pattern in patterns)
-    print("Part 1:", p1)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-    p2 = sum(reflection(pattern, penalty=1) for pattern in patterns)
+    print("Part 1:", p1)
     print("Part 2:", p2)
 
 
@@ -32,15 +30,26 @@ def read_input(fobj: TextIO):
         for pattern in fobj.read().strip().split('\n\n')
     ]
 
+
+def read_bytes(data: bytes) -> list[Pattern]:
+    """Parses the input read in binary mode, e.g. a memory-mapped file, one
+    record at a time.
+    """
+    return [Pattern.from_lines(lines) for lines in iter_records(data)]
+
 @dataclasses.dataclass(frozen=True)
 class Pattern:
-    rows: list[str]
-    cols: list[str]
+    rows: list[str] | list[bytes]
+    cols: list[str] | list[bytes]
     nrow: int
     ncol: int
 
     def __repr__(self):
-        return '\n'.join(self.rows) + '\n\n' + '\n'.join(self.cols)
+        rows, cols = (
+            [line.decode() if isinstance(line, bytes) else line for line in lines]
+            for lines in (self.rows, self.cols)
+        )
+        return '\n'.join(rows) + '\n\n' + '\n'.join(cols)
     
     @classmethod
     def from_str(cls, s: str) -> Self:
@@ -54,6 +63,11 @@ class Pattern:
             ncol=len(cols),
         )
 
+    @classmethod
+    def from_lines(cls, rows: list[bytes]) -> Self:
+        cols = [bytes(col) for col in zip(*rows)]
+        return cls(rows=rows, cols=cols, nrow=len(rows), ncol=len(cols))
+
 
 def expand_from_center(rows, i, j, penalty):
     cur_penalty = 0
@@ -84,6 +98,18 @@ def reflection(pattern: Pattern, penalty: int):
     return ans
 
 
+def p1_solve(patterns: list[Pattern]) -> int:
+    return sum(reflection(pattern, penalty=0) for pattern in patterns)
+
+
+def p2_solve(patterns: list[Pattern]) -> int:
+    return sum(reflection(pattern, penalty=1) for pattern in patterns)
+
+
+SOLUTION = register(13, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.cycles import nth_state
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -14,13 +17,10 @@ from functools import cached_property
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        platform = read_input(fobj)
-    
-    p1 = p1_solve(platform)
-    print("Part 1:", p1)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-    p2 = p2_solve(platform) 
+    print("Part 1:", p1)
     print("Part 2:", p2)
 
 
@@ -30,67 +30,78 @@ def read_input(fobj: TextIO):
     return Platform.from_str(fobj.read())
 
 
+def read_bytes(data: bytes) -> Platform:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Platform.from_bytes(data)
+
+
 @dataclasses.dataclass(frozen=True)
 class Platform:
-    grid: tuple[tuple[str]]
+    grid: Grid
 
     def __repr__(self):
-        return '\n'.join("".join(i) for i in self.grid)
+        return str(self.grid)
     
     @classmethod
     def from_str(cls, s: str) -> Self:
-        grid = tuple(tuple(line) for line in s.strip().splitlines())
-        return cls(
-            grid=grid,
-        )
+        return cls.from_bytes(s.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        return cls(grid=Grid.from_bytes(data))
 
 
-def tilt(grid, direction):
+def tilt(rows: Iterable[bytes], direction) -> list[bytes]:
+    """Rolls the rounded rocks of every row to the left or to the right,
+    segment by segment between the cube-shaped rocks.
+    """
     match direction:
         case "left":
-            split, reverse = more_itertools.split_after, True
+            fill = lambda n, size: b'O'*n + b'.'*(size-n)
         case "right":
-            split, reverse = more_itertools.split_before, False
+            fill = lambda n, size: b'.'*(size-n) + b'O'*n
         case _:
             raise ValueError("Direction must be either left or right.")
-        
-    cols = []
-    for col in grid:
-        partitions = split(col, lambda s: s == '#')
-        cols.append(
-            tuple(itertools.chain(
-                *(sorted(p, reverse=reverse) for p in partitions)
-            ))
-        )
-    return tuple(cols)
-
-
-def roll(grid): # normal
-    north = zip(*tilt(zip(*grid), "left")) # North: transpose -> tilt left -> transpose
+
+    return [
+        b'#'.join(fill(part.count(b'O'), len(part)) for part in row.split(b'#'))
+        for row in rows
+    ]
+
+
+def transpose(rows: Iterable[bytes]) -> list[bytes]:
+    return list(map(bytes, zip(*rows)))
+
+
+def roll(rows): # normal
+    north = transpose(tilt(transpose(rows), "left")) # North: transpose -> tilt left -> transpose
     west = tilt(north, "left") # West: tilt left
-    south = zip(*tilt(zip(*west), "right")) # South: transpose -> tilt right -> transpose
+    south = transpose(tilt(transpose(west), "right")) # South: transpose -> tilt right -> transpose
     east = tilt(south, "right") # East: tilt right
     return east
 
 
+def load(rows: list[bytes]) -> int:
+    return sum(row.count(b'O')*i for i, row in zip(range(len(rows), 0, -1), rows))
+
+
 def p1_solve(platform: Platform):
-    grid = tuple(zip(*tilt(zip(*platform.grid), "left")))
-    return sum(col.count('O')*i for i, col in zip(range(len(grid), 0, -1), grid))
+    return load(transpose(tilt(transpose(platform.grid.rows()), "left")))
 
 
 def p2_solve(platform: Platform):
     cycles = 10**9
-    grid = platform.grid
-    seen = {grid: 0}
-    while (grid := roll(grid)) not in seen:
-        seen[grid] = len(seen)
-        
-    cycle_begin = cycles - seen[grid]
-    cycle_length = len(seen) - seen[grid]
-    for _ in range(cycle_begin % cycle_length):
-        grid = roll(grid)
+    rows = nth_state(
+        list(platform.grid.rows()), roll, cycles,
+        key=lambda rows: hash(tuple(rows)),
+    )
+    return load(rows)
+
+
+SOLUTION = register(14, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
 
-    return sum(col.count('O')*i for i, col in zip(range(len(grid), 0, -1), grid))
 
 if __name__ == '__main__':
     program()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -16,15 +17,12 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        sequence = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    p1 = sum(hash_(procedure.string) for procedure in sequence)
     print("Part 1:", p1)
-
-    p2 = focusing_power(sequence)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
@@ -44,7 +42,7 @@ class Operation(StrEnum):
     ASSIGN: str = '='
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Procedure:
     string: str
     operation: Operation
@@ -88,8 +86,16 @@ def focusing_power(sequence: list[Procedure]) -> int:
         for box_id, box in boxes.items()
         for slot_id, focal_length in enumerate(box.values())
     )
-            
-           
+
+
+def p1_solve(sequence: list[Procedure]) -> int:
+    return sum(hash_(procedure.string) for procedure in sequence)
+
+
+SOLUTION = register(15, read_input, p1_solve, focusing_power)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
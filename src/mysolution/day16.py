@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
@@ -14,63 +16,95 @@ from functools import cached_property, cache, partial
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        contraption = read_input(fobj)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-
-    p1 = bfs((-1, 1), grid=contraption.grid)
     print("Part 1:", p1)
-
-    p2 = max(map(partial(bfs, grid=contraption.grid), ((pos-dir, dir) for dir in (1, 1j, -1, -1j)
-                 for pos in contraption.grid if (pos - dir) not in contraption.grid)))
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return Contraption.from_str(fobj.read())
 
 
+def read_bytes(data: bytes) -> Contraption:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Contraption.from_bytes(data)
+
+
 
 @dataclasses.dataclass
 class Contraption:
-    grid: dict[complex, str]
+    grid: Grid
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        grid = {}
-        for j, line in enumerate(s.strip().splitlines()):
-            for i, char in enumerate(line.strip()):
-                grid[complex(i, j)] = char
+        return cls.from_bytes(s.encode())
 
-        return cls(grid=grid)
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        # The border marks the edge, so beams move by adding a flat offset.
+        return cls(grid=Grid.from_bytes(data).padded())
 
 
 def bfs(start, grid=None):
-    visited = set()
+    """Counts the tiles energized by a beam that starts as `start = (pos, dir)`:
+    at the border cell of flat index `pos`, moving by the flat offset `dir`
+    (±1 or ±ncol). Each cell records the directions it was crossed in as a
+    bitmask, which stops beams that loop.
+    """
+    cells, w = grid.cells, grid.ncol
+    bits = {1: 1, -1: 2, w: 4, -w: 8}
+    slash = {1: -w, w: -1, -1: w, -w: 1} # rotate 90 degree
+    backslash = {1: w, w: 1, -1: -w, -w: -1} # rotate 270 degree
+
+    visited = bytearray(len(cells))
     q = [start]
     while q:
         pos, dir = q.pop()
-        while (pos, dir) not in visited:
-            visited.add((pos, dir))
+        while not visited[pos] & bits[dir]:
+            visited[pos] |= bits[dir]
             pos += dir
-            match grid.get(pos):
-                case '|':
-                    dir = 1j
+            match cells[pos]:
+                case 124: # '|'
+                    dir = w
                     q.append((pos, -dir))
-                case '-':
+                case 45: # '-'
                     dir = -1
                     q.append((pos, -dir))
-                case '/':
-                    dir = (dir * 1j).conjugate() # rotate 90 degree
-                case '\\':
-                    dir = (dir * -1j).conjugate() # rotate 270 degree
-                case None:
+                case 47: # '/'
+                    dir = slash[dir]
+                case 92: # '\\'
+                    dir = backslash[dir]
+                case 0: # edge
                     break
 
-    return len(set(pos for pos, _ in visited)) - 1
-            
+    return len(visited) - visited.count(0) - 1
+
+
+def p1_solve(contraption: Contraption) -> int:
+    grid = contraption.grid
+    return bfs((grid.index(1, 0), 1), grid=grid)
+
+
+def p2_solve(contraption: Contraption) -> int:
+    grid = contraption.grid
+    m, n = grid.nrow - 2, grid.ncol - 2
+    starts = itertools.chain(
+        ((grid.index(r, 0), 1) for r in range(1, m+1)),
+        ((grid.index(r, n+1), -1) for r in range(1, m+1)),
+        ((grid.index(0, c), grid.ncol) for c in range(1, n+1)),
+        ((grid.index(m+1, c), -grid.ncol) for c in range(1, n+1)),
+    )
+    return max(map(partial(bfs, grid=grid), starts))
+
+
+SOLUTION = register(16, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -2,82 +2,94 @@
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers import search
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
 from enum import IntEnum, StrEnum, unique 
 import itertools
 import more_itertools
 from functools import cached_property
-from heapq import heappop, heappush
-from collections import defaultdict
-from dataclasses import field
 
         
 @command_with_input_file
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        crucible = read_input(fobj)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-    p1 = shortest_path(crucible.grid, 1, 3)
     print("Part 1:", p1)
-
-    p2 = shortest_path(crucible.grid, 4, 10)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return Crucible.from_str(fobj.read())
 
 
+def read_bytes(data: bytes) -> Crucible:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Crucible.from_bytes(data)
+
+
 @dataclasses.dataclass(frozen=True)
 class Crucible:
-    grid: dict[complex, int]
+    grid: Grid
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        grid = {
-            complex(i, -j): int(num) 
-            for j, line in enumerate(s.strip().splitlines()) 
-            for i, num in enumerate(line.strip())
-        }
-        end = max(grid.keys(), key=lambda x: id(x))
-        return cls(grid=grid)
+        return cls.from_bytes(s.encode())
 
-
-@dataclasses.dataclass(frozen=True, order=True)
-class Block:
-    heat: int
-    moves: int
-    pos: complex = field(compare=False)
-    dir: complex = field(compare=False)
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        # The border marks the edge, so blocks move by adding a flat offset.
+        return cls(grid=Grid.from_bytes(data).padded())
 
 
 def shortest_path(grid, min_moves, max_moves):
-    end = max(grid.keys(), key=lambda x: id(x))
-    q = []
-    for i in (1, -1j):
-        heappush(q, Block(grid[i], 1, i, i))
-    min_heat = defaultdict(lambda : float('inf'))
-    while q:
-        block = heappop(q)
-
-        if block.pos == end and block.moves >= min_moves:
-            return block.heat 
-        
-        for moves, dir, min_moves in [(block.moves+1, block.dir, 1), 
-                                      (1, block.dir * 1j, min_moves),
-                                      (1, block.dir * -1j, min_moves)]:
-            if ((min_moves <= block.moves) and 
-                (moves <= max_moves) and 
-                (pos := block.pos + dir) in grid and
-                (heat := block.heat + grid[pos]) < min_heat[pos, dir, moves]):
-
-                heappush(q, Block(heat, moves, pos, dir))
-                min_heat[pos, dir, moves] = heat
+    """Finds the least heat loss from the top-left to the bottom-right block.
+
+    A state is a block together with the axis the crucible arrived along
+    (0 horizontally, 1 vertically), packed as `pos * 2 + axis`. From there it
+    turns and moves `min_moves` to `max_moves` blocks along the other axis, so
+    the number of straight moves never needs to be part of the state.
+    """
+    cells, w = grid.cells, grid.ncol
+    start, end = grid.index(1, 1), grid.index(grid.nrow - 2, grid.ncol - 2)
+    steps = ((w, -w), (1, -1))
+
+    def neighbors(state):
+        pos, axis = state >> 1, state & 1
+        for step in steps[axis]:
+            heat, next_pos = 0, pos
+            for moves in range(1, max_moves + 1):
+                next_pos += step
+                if not cells[next_pos]: # edge
+                    break
+                heat += cells[next_pos] - 48
+                if moves >= min_moves:
+                    yield next_pos << 1 | (axis ^ 1), heat
+
+    return search.shortest_path(
+        len(cells) * 2, (start << 1, start << 1 | 1), neighbors,
+        is_goal=lambda state: state >> 1 == end, buckets=True,
+    )
+
+
+def p1_solve(crucible: Crucible) -> int:
+    return shortest_path(crucible.grid, 1, 3)
+
+
+def p2_solve(crucible: Crucible) -> int:
+    return shortest_path(crucible.grid, 4, 10)
+
+
+SOLUTION = register(17, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -6,31 +6,50 @@ https://adventofcode.com/2023/day/n
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
+from helpers import geometry
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
-from collections import defaultdict
 
         
 @command_with_input_file
-def program(input_file):
+def program(input_file, stream=False):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        dig_plan = read_input(fobj)
+        p1, p2 = solve_stream(fobj) if stream else solve(fobj.read())
 
-    p1 = int(area_by_shoelace(dig_plan.fst_edges) + 1 - dig_plan.fst_points/2) + dig_plan.fst_points
     print("Part 1:", p1)
-
-    p2 = int(area_by_shoelace(dig_plan.snd_edges) + 1 - dig_plan.snd_points/2) + dig_plan.snd_points
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return DigPlan.from_str(fobj.read())
 
 
+def moves(line: str) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Returns the (dx, dy) moves of a line of the plan in both parts: the
+    direction and length, then the hexadecimal code of the color.
+    """
+    dir, length, color = line.strip().split()
+    match dir:
+        case 'U': fst = 0, -int(length)
+        case 'D': fst = 0, int(length)
+        case 'L': fst = -int(length), 0
+        case 'R': fst = int(length), 0
+
+    code = color.strip('(#)')
+    length, dir  = int(code[:-1], 16), code[-1]
+    match dir:
+        case '0': snd = length, 0
+        case '1': snd = 0, length
+        case '2': snd = -length, 0
+        case '3': snd = 0, -length
+    return fst, snd
+
+
 @dataclasses.dataclass(frozen=True)
 class DigPlan:
     fst_edges: list[tuple[int, int]]
@@ -41,46 +60,53 @@ class DigPlan:
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        x, y = 0, 0
-        fst_edges = []
-        fst_points = 0
-        for line in s.strip().splitlines():
-            dir, length, color = line.strip().split()
-            match dir:
-                case 'U': dx, dy = 0, -int(length)
-                case 'D': dx, dy = 0, int(length)
-                case 'L': dx, dy = -int(length), 0
-                case 'R': dx, dy = int(length), 0
-            x, y = x + dx, y + dy
-            fst_edges.append((x, y))
-            fst_points += int(length) 
-
-        x, y = 0, 0
-        snd_edges = []
-        snd_points = 0
+        edges = ([], [])
+        points = [0, 0]
+        positions = [(0, 0), (0, 0)]
         for line in s.strip().splitlines():
-            *_, color = line.strip().split()
-            code = color.strip('(#)')
-            length, dir  = code[:-1], code[-1]
-            match dir:
-                case '0': dx, dy = int(length, 16), 0
-                case '1': dx, dy = 0, int(length, 16)
-                case '2': dx, dy = -int(length, 16), 0
-                case '3': dx, dy = 0, -int(length, 16)
-            x, y = x + dx, y + dy
-            snd_edges.append((x, y))
-            snd_points += int(length, 16)
+            for part, (dx, dy) in enumerate(moves(line)):
+                x, y = positions[part]
+                positions[part] = x + dx, y + dy
+                edges[part].append(positions[part])
+                points[part] += abs(dx) + abs(dy)
 
         return cls(
-            fst_edges=fst_edges, fst_points=fst_points, 
-            snd_edges=snd_edges, snd_points=snd_points
+            fst_edges=edges[0], fst_points=points[0], 
+            snd_edges=edges[1], snd_points=points[1]
         )
 
 
-def area_by_shoelace(edges: list[tuple[int, int]]):
-    x, y = zip(*edges)
-    return abs(sum(x[i-1]*y[i]-x[i]*y[i-1] for i in range(len(x)))) / 2.
- 
+def lagoon_size(edges: list[tuple[int, int]], points: int) -> int:
+    return geometry.interior_points(geometry.shoelace(*zip(*edges)), points) + points
+
+
+def p1_solve(dig_plan: DigPlan) -> int:
+    return lagoon_size(dig_plan.fst_edges, dig_plan.fst_points)
+
+
+def p2_solve(dig_plan: DigPlan) -> int:
+    return lagoon_size(dig_plan.snd_edges, dig_plan.snd_points)
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts while reading the lines, in constant memory: the
+    area and the boundary of both lagoons are accumulated vertex by vertex.
+    """
+    lagoons = (geometry.Shoelace([(0, 0)]), geometry.Shoelace([(0, 0)]))
+    positions = [(0, 0), (0, 0)]
+    for line in lines:
+        if not line.strip():
+            continue
+        for part, (dx, dy) in enumerate(moves(line)):
+            x, y = positions[part]
+            positions[part] = x + dx, y + dy
+            lagoons[part].add(*positions[part])
+    return lagoons[0].lattice_points, lagoons[1].lattice_points
+
+
+SOLUTION = register(18, read_input, p1_solve, p2_solve, solve_stream)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
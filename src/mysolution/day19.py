@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.intervals import IntervalSet
+from helpers.registry import register
 import dataclasses
 from enum import StrEnum, unique
 import re
@@ -17,28 +19,19 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        system = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    rating_ranges = list(rating_range(system.workflows))
-    p1 = 0
-    for parts in system.listed_parts:
-        for ratings in rating_ranges: 
-            if parts in ratings:
-                p1 += sum(parts)
     print("Part 1:", p1)
-     
-    p2 = sum(math.prod(rating.stop - rating.start 
-                        for rating in ratings) for ratings in rating_ranges)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return System.from_str(fobj.read())
 
 
-@dataclasses.dataclass(frozen=True, order=True)
+@dataclasses.dataclass(frozen=True, order=True, slots=True)
 class Part:
     xmas: tuple[int, ...]
 
@@ -46,9 +39,9 @@ class Part:
         yield from self.xmas
 
 
-@dataclasses.dataclass(frozen=True, order=True)
+@dataclasses.dataclass(frozen=True, order=True, slots=True)
 class RatingRange:
-    xmas: tuple[range, ...]
+    xmas: tuple[IntervalSet, ...]
 
     def __contains__(self, part: Part):
         return all(
@@ -83,7 +76,7 @@ class System:
 
 
 def rating_range(workflows: dict[str, tuple[list[str], str]]):
-    stack = [('in', {r: range(1, 4001) for r in 'xmas'})]
+    stack = [('in', dict.fromkeys('xmas', IntervalSet.range(1, 4001)))]
     while stack:
         name, ratings = stack.pop()
         if name == 'R':
@@ -96,17 +89,39 @@ def rating_range(workflows: dict[str, tuple[list[str], str]]):
         rules, default = workflows[name]
         for rule in rules:
             key, op, num, _, dest = re.split(r'(\W+)', rule)
-            if (val := int(num)) in ratings[key]:
-                match op:
-                    case '<':
-                        stack.append((dest, ratings | {key: range(ratings[key].start, val)}))
-                        ratings.update({key: range(val, ratings[key].stop)})
-                    case '>':
-                        stack.append((dest, ratings | {key: range(val+1, ratings[key].stop)}))
-                        ratings.update({key: range(ratings[key].start, val+1)})
-
-        stack.append((default, ratings))
-    
+            match op:
+                case '<':
+                    matched = IntervalSet.range(1, int(num))
+                case '>':
+                    matched = IntervalSet.range(int(num)+1, 4001)
+
+            if accepted := ratings[key] & matched:
+                stack.append((dest, ratings | {key: accepted}))
+            ratings[key] = ratings[key] - matched
+            if not ratings[key]:
+                break
+        else:
+            stack.append((default, ratings))
+
+
+def p1_solve(system: System) -> int:
+    rating_ranges = list(rating_range(system.workflows))
+    p1 = 0
+    for parts in system.listed_parts:
+        for ratings in rating_ranges:
+            if parts in ratings:
+                p1 += sum(parts)
+    return p1
+
+
+def p2_solve(system: System) -> int:
+    return sum(math.prod(rating.size for rating in ratings)
+               for ratings in rating_range(system.workflows))
+
+
+SOLUTION = register(19, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -6,13 +6,16 @@ https://adventofcode.com/2023/day/n
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
+from helpers import metrics
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.cycles import event_times, first_common_time
+from helpers.graph import Graph, dfs
+from helpers.registry import register
 from enum import StrEnum, unique, IntFlag
 import dataclasses
 from dataclasses import field
-from collections import deque, defaultdict
-import itertools
-import math
+from collections import deque
+from functools import cached_property
 
         
 @command_with_input_file
@@ -20,15 +23,12 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    answers = solve(puzzle)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
-    print("Part 1:", next(answers))
 
-    print("Part 2:", next(answers))
-
-   
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
@@ -80,67 +80,136 @@ class Puzzle:
             modules[module.name] = module
         return cls(modules=modules)
 
+    @cached_property
+    def graph(self) -> Graph:
+        return Graph.from_edges(
+            ((src, dest) for src, module in self.modules.items() for dest in module),
+            nodes=self.modules,
+        )
+
+
+class Machine:
+    """The modules wired over the nodes and edges of the puzzle's graph, with
+    their whole state in one bytearray: the flip-flop of every node, the last
+    pulse of every edge, the number of high inputs of every conjunction and,
+    in the last byte, whether the `watch` module sent a high pulse during the
+    previous press.
+    Only the modules `within` (all by default) handle pulses; the others
+    swallow them.
+    """
 
-def solve(puzzle):
-    modules = puzzle.modules
+    def __init__(self, puzzle: Puzzle, within: Iterable[int] | None = None, watch: int = -1):
+        modules, graph = puzzle.modules, puzzle.graph
+        self.offsets, self.targets = graph.offsets, graph.targets
+        # Modules that are only destinations have no type and swallow pulses.
+        self.types = [modules[name].module_type if name in modules else None for name in graph.names]
+        if within is not None:
+            within = set(within)
+            self.types = [t if node in within else None for node, t in enumerate(self.types)]
+        self.inputs = [0] * len(graph)
+        for dest in self.targets:
+            self.inputs[dest] += 1
+        self.broadcaster = graph.ids['broadcaster']
+        self.watch = watch
+        self.size = len(graph) + graph.num_edges + len(graph) + 1
+        self.presses = 0
+        self.counter = [0, 0]
+
+    def initial(self) -> bytearray:
+        return bytearray(self.size)
+
+    def press(self, state: bytearray) -> None:
+        """Pushes the button once, updating `state` in place.
+        """
+        types, offsets, targets, inputs = self.types, self.offsets, self.targets, self.inputs
+        counter, watch = self.counter, self.watch
+        # A conjunction remembers the last pulse of each input edge, and sends
+        # a low pulse when all of them are high.
+        memory, highs = len(inputs), len(inputs) + len(targets)
+        fired = 0
+
+        self.presses += 1
+        q = deque([(Pulse.LOW, -1, self.broadcaster)])
+        counter[Pulse.LOW] += 1
+        while q:
+            pulse, edge, dest = q.popleft()
 
-    pulses = defaultdict(dict)
-    flipflops = dict()
-    conjunctions = dict()
+            match types[dest]:
+                case None:
+                    continue
+                case ModuleType.FLIP_FLOP:
+                    if pulse:
+                        continue
+                    pulse = state[dest] = state[dest] ^ 1
+                case ModuleType.CONJUNCTION:
+                    state[highs + dest] += pulse - state[memory + edge]
+                    state[memory + edge] = pulse
+                    pulse = int(state[highs + dest] != inputs[dest])
+                    if pulse and dest == watch:
+                        fired = 1
+
+            for e in range(offsets[dest], offsets[dest + 1]):
+                counter[pulse] += 1
+                q.append((pulse, e, targets[e]))
 
-    for src, module in modules.items():
-        for dest in module.dests:
-            if dest not in modules:
-                continue
+        state[-1] = fired
 
-            if modules[dest].module_type == ModuleType.CONJUNCTION:
-                pulses[dest][src] = Pulse.LOW
-                conjunctions[dest] = None
+    def step(self, state: bytes) -> bytes:
+        """The state after one press from `state`, for the cycle finder.
+        """
+        state = bytearray(state)
+        self.press(state)
+        return bytes(state)
 
-            if modules[dest].module_type == ModuleType.FLIP_FLOP:
-                flipflops[dest] = 0
+    @staticmethod
+    def fired(state: bytes) -> bool:
+        return bool(state[-1])
+
+    def record_metrics(self) -> None:
+        metrics.count('day20_button_presses', self.presses)
+        metrics.count('day20_pulses', sum(self.counter))
 
-    
-    counter = defaultdict(int)
-    for cycle in itertools.count():
-        q = deque([(Pulse.LOW, 'button', 'broadcaster')])
-        counter[Pulse.LOW] += 1
-        while q:
-            pulse, src, dest = q.popleft()
-            # print(f'{src} -{pulse.name.lower()}-> {dest}')
-            
-            if dest not in modules:
-                continue
-
-            module = modules[dest]
-            match [module.module_type, pulse]:
-                case [ModuleType.FLIP_FLOP, Pulse.HIGH]:
-                    continue
-                case [ModuleType.FLIP_FLOP, Pulse.LOW]:
-                    flipflops[dest] ^= 1
-                    pulse = Pulse(flipflops[dest])
-                case [ModuleType.CONJUNCTION, _]:
-                    pulses[dest][src] = pulse
-                    pulse = ~Pulse(all(pulses[dest].values()))
-            
-            if (module.module_type == ModuleType.CONJUNCTION and 
-                pulse == Pulse.HIGH and 
-                conjunctions[dest] is None):
-
-                conjunctions[dest] = cycle + 1
-
-                if all(conjunctions.values()):
-                    # Part 2
-                    yield math.lcm(*conjunctions.values())
-                    return
-
-            for next_dest in module:
-                counter[pulse] += 1
-                q.append((pulse, dest, next_dest))
 
-        if cycle + 1 == 1000:
-            # Part 1 
-            yield counter[Pulse.LOW] * counter[Pulse.HIGH]
+def p1_solve(puzzle: Puzzle) -> int:
+    machine = Machine(puzzle)
+    state = machine.initial()
+    for _ in range(1000):
+        machine.press(state)
+    machine.record_metrics()
+    return machine.counter[Pulse.LOW] * machine.counter[Pulse.HIGH]
+
+
+def p2_solve(puzzle: Puzzle) -> int | None:
+    """Finds the first press on which every input of the conjunction feeding
+    `rx` sends a high pulse, which gives `rx` a low pulse when they are high
+    at the same time within the press, as in the puzzle's network.
+
+    The modules upstream of each input only receive pulses from each other
+    and the broadcaster, so each such circuit is pressed on its own until
+    its state cycles, without assuming it fires periodically from the first
+    press; the presses on which the inputs fire are then combined.
+    """
+    graph = puzzle.graph
+    if 'rx' not in graph.ids:
+        return None  # the samples have no part 2
+
+    parents = graph.reversed()
+    match [puzzle.modules.get(graph.names[u]) for u in parents.successors(graph.ids['rx'])]:
+        case [Module(module_type=ModuleType.CONJUNCTION) as final]:
+            pass
+        case _:
+            raise ValueError("rx must be fed by a single conjunction.")
+
+    times = []
+    for feeder in dict.fromkeys(parents.successors(graph.ids[final.name])):
+        machine = Machine(puzzle, within=dfs(parents, feeder), watch=feeder)
+        times.append(event_times(bytes(machine.initial()), machine.step, machine.fired))
+        machine.record_metrics()
+    return first_common_time(times)
+
+
+SOLUTION = register(20, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -6,69 +6,73 @@ https://adventofcode.com/2023/day/n
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
-from collections import deque, OrderedDict, defaultdict
-import numpy as np
 
         
 @command_with_input_file
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-
-    p1 = p1_solve(puzzle)
     print("Part 1:", p1)
-
-    p2 = p2_solve(puzzle)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return Puzzle.from_str(fobj.read())
 
 
+def read_bytes(data: bytes) -> Puzzle:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Puzzle.from_bytes(data)
+
+
 @dataclasses.dataclass(frozen=True)
 class Puzzle:
-    grid: list[list[int]]
+    grid: Grid
     entry: tuple[int, int]
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        grid = []
-        for r, line in enumerate(s.strip().splitlines()):
-            row = []
-            for c, char in enumerate(line.strip()):
-                if char == 'S':
-                    entry = (r, c)
-                    char = '.'
-                row.append(char)
-            grid.append(row)
-        
+        return cls.from_bytes(s.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        grid = Grid.from_bytes(data)
+        entry = grid.position(grid.find(b'S'))
         return cls(grid=grid, entry=entry)
 
 
 def bfs(puzzle, steps):
-    default_grid, entry = puzzle.grid, puzzle.entry
-    m, n = len(default_grid), len(default_grid[0])
-    grid = dict()
-    queue = deque([entry])
-    for step in range(steps):
-        for _ in range(len(queue)):
-            row, col = queue.popleft()
-            grid[row, col] = '.'
-            for r, c in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                pos = row + r, col + c
-                default_pos = default_grid[pos[0]%m][pos[1]%n]
-                if grid.setdefault(pos, default_pos) == '.':
-                    grid[pos] = 'O'
-                    queue.append(pos)
-    return len(queue)
+    """Counts the garden plots reachable in exactly `steps` steps on the
+    infinitely repeated map. The map is bipartite and a plot can be left and
+    re-entered, so those are the plots at a distance of at most `steps` with
+    the same parity.
+    """
+    cells, m, n = puzzle.grid.cells, puzzle.grid.nrow, puzzle.grid.ncol
+    rock = ord('#')
+    queue = [puzzle.entry]
+    visited = {puzzle.entry}
+    reachable = 1 if steps % 2 == 0 else 0
+    for step in range(1, steps+1):
+        frontier = []
+        for row, col in queue:
+            for pos in ((row, col-1), (row, col+1), (row-1, col), (row+1, col)):
+                if pos not in visited and cells[pos[0]%m*n + pos[1]%n] != rock:
+                    visited.add(pos)
+                    frontier.append(pos)
+        if step % 2 == steps % 2:
+            reachable += len(frontier)
+        queue = frontier
+    return reachable
     
 
 def p1_solve(puzzle):
@@ -77,6 +81,8 @@ def p1_solve(puzzle):
 
 # Copy pasterino
 def p2_solve(puzzle):
+    import numpy as np
+
     # polynomial extrapolation
     a0 = bfs(puzzle, 0*131 + 65)
     a1 = bfs(puzzle, 1*131 + 65)
@@ -91,6 +97,10 @@ def p2_solve(puzzle):
     return x[0] * n * n + x[1] * n + x[2]
 
 
+SOLUTION = register(21, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
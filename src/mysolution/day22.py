@@ -7,10 +7,9 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.graph import Graph
+from helpers.registry import register
 import dataclasses
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import itertools
 import re
 from collections import defaultdict, deque
@@ -21,16 +20,12 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-
-    p1 = p1_solve(puzzle)
     print("Part 1:", p1)
-
-    p2 = p2_solve(puzzle)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
@@ -39,13 +34,19 @@ def read_input(fobj: TextIO):
 
 @dataclasses.dataclass
 class Puzzle:
-    children: dict[int, set[int]]
-    parents: dict[int, set[int]]
+    children: Graph
+    parents: Graph
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        x, y, z = np.indices((10, 10, 321))
-        voxelarray = np.zeros((10, 10, 321), dtype=bool)
+        import numpy as np
+
+        coords = [tuple(map(int, re.split(r'\D', line))) for line in s.strip().splitlines()]
+        # Sized to hold every brick above the ground at z = 0.
+        shape = tuple(max(max(c[axis], c[axis + 3]) for c in coords) + 1 if coords else 1
+                      for axis in range(3))
+        x, y, z = np.indices(shape)
+        voxelarray = np.zeros(shape, dtype=bool)
         grid = np.empty(voxelarray.shape, dtype=object)
 
         bricks = []
@@ -54,11 +55,12 @@ class Puzzle:
         voxelarray[:,:,0] = True
 
 
+        # import matplotlib.pyplot as plt
+        # import matplotlib.colors as mcolors
         # it = itertools.cycle(mcolors.TABLEAU_COLORS)
         # colors = np.empty(voxelarray.shape, dtype=object)
         # colors[voxelarray] = 'grey'
-        for line in s.strip().splitlines():
-            x1, y1, z1, x2, y2, z2 = map(int, re.split(r'\D', line))
+        for x1, y1, z1, x2, y2, z2 in coords:
             brick = (x >= x1) & (x <= x2) & (y >= y1) & (y <= y2) & (z >= z1) & (z <= z2)
             bricks.append((z2, brick))
                         
@@ -80,33 +82,48 @@ class Puzzle:
         # ax.voxels(voxelarray, facecolors=colors, edgecolor='k')
 
         # plt.show()
-        return cls(children=children, parents=parents)
+
+        # Brick ids come first, the ground (None) is the last node.
+        children = Graph.from_edges(
+            ((base, idx) for base, above in children.items() for idx in sorted(above)),
+            nodes=[*range(len(bricks)), None],
+        )
+        return cls(children=children, parents=children.reversed())
        
 
 def p1_solve(puzzle):
+    children, parents = puzzle.children, puzzle.parents
     ans = 0
-    for brick in puzzle.parents.keys():
-        if all(len(puzzle.parents[b]) > 1 for b in puzzle.children[brick]):
+    for brick in range(len(children) - 1):
+        if all(parents.degree(b) > 1 for b in children.successors(brick)):
             ans += 1
     return ans
 
 
 def p2_solve(puzzle):
+    children, parents = puzzle.children, puzzle.parents
+    offsets, targets = children.offsets, children.targets
     ans = 0
-    for start in puzzle.parents.keys():
-        falls = {start}
+    for start in range(len(children) - 1):
+        # A brick falls once all of the bricks it rests on have fallen.
+        remaining = {}
         q = deque([start])
         while q:
             brick = q.popleft()
-            for b in puzzle.children[brick]:
-                if not (puzzle.parents[b] - falls):
-                    falls.add(b)
+            for e in range(offsets[brick], offsets[brick + 1]):
+                b = targets[e]
+                if (left := remaining.get(b, parents.degree(b)) - 1):
+                    remaining[b] = left
+                else:
                     q.append(b)
-
-        ans += len(falls) - 1
+                    ans += 1
     return ans
 
 
+SOLUTION = register(22, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
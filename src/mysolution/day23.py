@@ -6,146 +6,141 @@ https://adventofcode.com/2023/day/n
 from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
-from helpers.cli import command_with_input_file, open_input_file
+from helpers import metrics
+from helpers.cli import command_with_input_file, open_input_bytes
+from helpers.graph import Graph, topological_order
+from helpers.grid import Grid
+from helpers.registry import register
 import dataclasses
 from collections import deque, defaultdict
-import itertools
-import heapq
-from pprint import pprint
 
 
 @command_with_input_file
 def program(input_file):
     """Main program.
     """
-    with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+    with open_input_bytes(input_file) as data:
+        p1, p2 = solve(data)
 
-    p1 = p1_solve(puzzle)
     print("Part 1:", p1)
-
-    p2 = p2_solve(puzzle)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
     return Puzzle.from_str(fobj.read())
 
 
+def read_bytes(data: bytes) -> Puzzle:
+    """Parses the input read in binary mode, e.g. a memory-mapped file.
+    """
+    return Puzzle.from_bytes(data)
+
+
 @dataclasses.dataclass
 class Puzzle:
-    grid: list[list[str]]
-    slopes: list[tuple[int, int, str]]
+    grid: Grid
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        grid, slopes = [], []
-        for r, line in enumerate(s.strip().splitlines()):
-            row = []
-            for c, char in enumerate(line.strip()):
-                if char in '^v<>':
-                    slopes.append((r, c, char))
-                row.append(char)
-            grid.append(row)
+        return cls.from_bytes(s.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        return cls(grid=Grid.from_bytes(data))
+
+    @property
+    def start(self) -> int:
+        return self.grid.cells.index(b'.')
+
+    @property
+    def end(self) -> int:
+        return self.grid.cells.rindex(b'.')
 
-        return cls(grid=grid, slopes=slopes)
+
+FOREST = ord('#')
+SLOPES = {ord(char): char for char in '^v<>'}
 
 
 def p1_solve(puzzle):
     grid = puzzle.grid
-    slopes = puzzle.slopes
-    m, n = len(grid), len(grid[0])
-
-    x, y = 0, grid[0].index('.')
-    start = (x, y)
-    end = (m-1, grid[m-1].index('.'))
+    cells = grid.cells
+    start, end = puzzle.start, puzzle.end
 
-    src, dir, dist = (x, y), 'v', 0
-    q = deque([(src, x, y, dir, dist)])
+    src, dir, dist = start, 'v', 0
+    q = deque([(src, start, dir, dist)])
     nodes = defaultdict(dict)
 
     while q:
-        src, x, y, dir, dist = q.popleft()
+        src, pos, dir, dist = q.popleft()
         for dx, dy, new_dir, opposed in [(-1, 0, '^', 'v'), 
                                     (1, 0, 'v', '^'), 
                                     (0, -1, '<', '>'), 
                                     (0, 1, '>', '<')]:
-            pos_x, pos_y = x + dx, y + dy
-            if (pos_x < 0 or pos_x >= m or
-                pos_y < 0 or pos_y >= n or 
-                grid[pos_x][pos_y] == '#' or
+            new_pos = grid.step(pos, dx, dy)
+            if (new_pos is None or
+                cells[new_pos] == FOREST or
                 dir == opposed):
                 continue
 
-            if (pos_x, pos_y) == end:
+            if new_pos == end:
                 nodes[src][end] = dist + 1
                 continue
 
-            if grid[pos_x][pos_y] == '.':
-                q.append((src, pos_x, pos_y, new_dir, dist+1))
-
-            elif grid[pos_x][pos_y] != opposed:
-                if (dest := (pos_x, pos_y)) not in nodes[src]:
-                    nodes[src][dest] = dist + 1
-                    q.append((dest, pos_x, pos_y, grid[pos_x][pos_y], 0))
-
-    # print('\n'.join(f'{i:2} ' + ''.join(row) for i, row in enumerate(grid)))
-
-    ans = []
-    q = deque([(start, 0)])
-    while q:
-        src, dist = q.popleft()
-        for dest, value in nodes[src].items():
-            if dest == end:
-                ans.append(dist+value)
-            else:
-                q.append((dest, dist + value))
-    
-    return max(ans)
-
+            if (slope := SLOPES.get(cells[new_pos])) is None:
+                q.append((src, new_pos, new_dir, dist+1))
+
+            elif slope != opposed:
+                if new_pos not in nodes[src]:
+                    nodes[src][new_pos] = dist + 1
+                    q.append((new_pos, new_pos, slope, 0))
+
+    # The slopes make the junction graph acyclic: relax it in order.
+    graph = Graph.from_edges(
+        (src, dest, dist) for src, dests in nodes.items() for dest, dist in dests.items()
+    )
+    longest = [None] * len(graph)
+    longest[graph.ids[start]] = 0
+    for u in topological_order(graph):
+        if longest[u] is None:
+            continue
+        for v, dist in graph.edges(u):
+            if longest[v] is None or longest[u] + dist > longest[v]:
+                longest[v] = longest[u] + dist
 
-DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    return longest[graph.ids[end]]
 
 
-def get_neighbors(grid, x, y):
-    m, n = len(grid), len(grid[0])
-    for dx, dy in DIRECTIONS:
-        if (0 <= (new_x := x + dx) < m and 
-            0 <= (new_y := y + dy) < n and
-            grid[new_x][new_y] != '#'):
-            yield new_x, new_y
+def get_neighbors(grid, i):
+    cells = grid.cells
+    for j in grid.neighbors(i):
+        if cells[j] != FOREST:
+            yield j
         
 
 # Copy pasterino
 def p2_solve(puzzle):
     grid = puzzle.grid
-    slopes = puzzle.slopes
-    m, n = len(grid), len(grid[0])
-
-    x, y = 0, grid[0].index('.')
-    start = (x, y)
-    end = (m-1, grid[m-1].index('.'))
+    start, end = puzzle.start, puzzle.end
     
     stack = [start]
     visited = set()
     graph = defaultdict(list)
 
     while stack:
-        x, y = stack.pop()
-        if (x, y) in visited:
+        u = stack.pop()
+        if u in visited:
             continue
 
-        for new_x, new_y in get_neighbors(grid, x, y):
+        for new_pos in get_neighbors(grid, u):
             dist = 1
-            prev_x, prev_y = x, y
-            pos_x, pos_y = new_x, new_y
+            prev, pos = u, new_pos
             ended = False
 
             while True:
-                neighbors = list(get_neighbors(grid, pos_x, pos_y))
-                if neighbors == [(prev_x, prev_y)] and grid[x][y] in '^v><':
+                neighbors = list(get_neighbors(grid, pos))
+                if neighbors == [prev] and grid.cells[u] in SLOPES:
                     ended = True
                     break
 
@@ -153,30 +148,49 @@ def p2_solve(puzzle):
                     break
 
                 for neighbor in neighbors:
-                    if neighbor != (prev_x, prev_y):
+                    if neighbor != prev:
                         dist += 1
-                        prev_x, prev_y = pos_x, pos_y
-                        pos_x, pos_y = neighbor
+                        prev, pos = pos, neighbor
                         break
             if ended:
                 continue
 
-            graph[x, y].append(((pos_x, pos_y), dist))
-            stack.append((pos_x, pos_y))
+            graph[u].append((pos, dist))
+            stack.append(pos)
+
+        visited.add(u)
+
+    graph = Graph.from_edges(
+        (u, v, dist) for u, edges in graph.items() for v, dist in edges
+    )
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights or [1] * graph.num_edges
+    start, end = graph.ids[start], graph.ids[end]
 
-        visited.add((x, y))
+    # When the end has a single neighbor, a path reaching that neighbor must
+    # go to the end right away, since it could not reach the end afterwards.
+    last, last_dist = end, 0
+    if graph.degree(end) == 1:
+        last, last_dist = targets[offsets[end]], weights[offsets[end]]
 
-    ans = []
-    stack = [(start, 0, {start})]
+    # Visited junctions are kept as a bitmask of node ids.
+    ans = paths = 0
+    stack = [(start, 0, 1 << start)]
     while stack:
         u, dist, visited = stack.pop()
-        if u == end:
-            ans.append(dist)
+        if u == last:
+            ans = max(ans, dist + last_dist)
+            paths += 1
             continue
-        for v, d in graph[u]:
-            if v not in visited:
-                stack.append((v, dist + d, visited | {v}))
-    return max(ans)
+        for e in range(offsets[u], offsets[u + 1]):
+            if not visited >> (v := targets[e]) & 1:
+                stack.append((v, dist + weights[e], visited | 1 << v))
+    metrics.count('day23_complete_paths', paths)
+    return ans
+
+
+SOLUTION = register(23, read_input, p1_solve, p2_solve, read_bytes=read_bytes)
+solve = SOLUTION.solve
 
 
 if __name__ == '__main__':
@@ -5,12 +5,14 @@ https://adventofcode.com/2023/day/n
 
 from __future__ import annotations
 
-from typing import TextIO, Iterable, Self
+from typing import TextIO, Iterable, Self, TYPE_CHECKING
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
-import numpy as np
 import itertools
-from sympy import Symbol, solve_poly_system
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @command_with_input_file
@@ -18,15 +20,12 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-    p1 = p1_solve(puzzle)
     print("Part 1:", p1)
-
-    p2 = p2_solve(puzzle)
     print("Part 2:", p2)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
@@ -41,6 +40,8 @@ class Puzzle:
 
     @classmethod
     def from_str(cls, s: str) -> Self:
+        import numpy as np
+
         A, B, C = [], [], []
         for line in s.strip().splitlines():
             position, velocity = line.strip().split('@')
@@ -53,6 +54,8 @@ class Puzzle:
 
 
 def p1_solve(puzzle):
+    import numpy as np
+
     n = len(puzzle.A)
     A = puzzle.A 
     B = puzzle.B
@@ -81,6 +84,8 @@ def p1_solve(puzzle):
 
 # Copy pasterino
 def p2_solve(puzzle):
+    from sympy import Symbol, solve_poly_system
+
     C = puzzle.C
     n = len(C)
 
@@ -101,7 +106,11 @@ def p2_solve(puzzle):
 
     ans = solve_poly_system(equations, *([x, y, z, u, v, w] + t_syms))[0][:3]
     return sum(ans)
-                
+
+
+SOLUTION = register(24, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
 
 if __name__ == '__main__':
     program()
@@ -7,10 +7,10 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.graph import Graph
+from helpers.registry import register
 import dataclasses
-import networkx as nx
-import itertools
-import math
+from collections import deque
 
         
 @command_with_input_file
@@ -18,12 +18,11 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        puzzle = read_input(fobj)
+        p1, _ = solve(fobj.read())
 
-    p1 = solve(puzzle)
     print("Part 1:", p1)
 
-   
+
 def read_input(fobj: TextIO):
     """Reads and parses input file according to problem statement.
     """
@@ -32,29 +31,73 @@ def read_input(fobj: TextIO):
 
 @dataclasses.dataclass
 class Puzzle:
-    graph: nx.Graph
+    graph: Graph
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        graph = nx.Graph()
+        edges = []
         for line in s.strip().splitlines():
             u, nodes = line.strip().split(':')
             for v in nodes.strip().split(' '):
-                graph.add_edge(u, v, capacity=1.0)
-        return cls(graph=graph)
+                edges.append((u, v))
+        return cls(graph=Graph.from_edges(edges, undirected=True))
+
+
+def min_cut(graph: Graph, s: int, t: int, limit: int) -> tuple[int, list[int]]:
+    """Finds up to `limit` edge-disjoint paths from `s` to `t` in a graph of
+    unit capacity undirected edges. Returns their number and, when fewer than
+    `limit` exist (i.e. it is the minimum cut), the nodes still reachable from
+    `s` in the residual graph, which form the side of `s`.
+    """
+    offsets, targets = graph.offsets, graph.targets
+
+    # Each undirected edge is stored as two arcs; the net flow of an arc is
+    # the opposite of its mate's, and its residual capacity is 1 - flow.
+    mates = {}
+    for u in range(len(graph)):
+        for e in range(offsets[u], offsets[u + 1]):
+            mates[u, targets[e]] = e
+    mate = [mates[targets[e], u] for u in range(len(graph)) for e in range(offsets[u], offsets[u + 1])]
+    flow = [0] * graph.num_edges
+
+    for paths in range(limit):
+        via = [-1] * len(graph)
+        via[s] = graph.num_edges
+        queue = deque([s])
+        while queue and via[t] < 0:
+            u = queue.popleft()
+            for e in range(offsets[u], offsets[u + 1]):
+                if via[v := targets[e]] < 0 and flow[e] < 1:
+                    via[v] = e
+                    queue.append(v)
 
+        if via[t] < 0:
+            return paths, [u for u in range(len(graph)) if via[u] >= 0]
 
-def solve(puzzle):
+        v = t
+        while v != s:
+            e = via[v]
+            flow[e] += 1
+            flow[mate[e]] -= 1
+            v = targets[mate[e]]
+
+    return limit, []
+
+
+def p1_solve(puzzle):
     graph = puzzle.graph
-    
-    for s, t in itertools.combinations(graph.nodes, 2):
-        cut_value, (reachable, non_reachable) = nx.minimum_cut(graph, s, t)
+
+    # The three wires to cut are the only minimum cut, so the first node is
+    # separated from any node of the other component by exactly three paths.
+    for t in range(1, len(graph)):
+        cut_value, reachable = min_cut(graph, 0, t, 4)
         if cut_value == 3:
-            return len(reachable) * len(non_reachable)
+            return len(reachable) * (len(graph) - len(reachable))
+
+
+SOLUTION = register(25, read_input, p1_solve)
+solve = SOLUTION.solve
 
-    # cutset = nx.minimum_edge_cut(graph)
-    # graph.remove_edges_from(cutset)
-    # return math.prod(len(c) for c in nx.connected_components(graph))
 
 if __name__ == '__main__':
     program()
@@ -0,0 +1,654 @@
+#!/usr/bin/env python3
+"""Generates synthetic puzzle inputs of adjustable size for every day.
+
+Every generator takes a seeded `random.Random`, a `scale` relative to the size
+of the real puzzle input and optional structural knobs, and returns the input
+text. The same seed, scale and knobs always produce the same input.
+"""
+from __future__ import annotations
+
+import ast
+import itertools
+import math
+import random
+import string
+from pathlib import Path
+from typing import Callable
+
+import click
+
+GENERATORS: dict[int, Callable[..., str]] = {}
+
+
+def generator(day: int):
+    """Registers the input generator of a day.
+    """
+    def decorator(func):
+        GENERATORS[day] = func
+        return func
+    return decorator
+
+
+@click.command()
+@click.argument('days', nargs=-1, type=click.IntRange(1, 25))
+@click.option('--scale', default=1., show_default=True, type=click.FloatRange(min=0, min_open=True),
+              help="Size relative to the real puzzle input.")
+@click.option('--seed', default=2023, show_default=True, help="Random seed.")
+@click.option('-p', '--param', 'params', multiple=True, metavar='KNOB=VALUE',
+              help="Overrides a structural knob of the generator, e.g. -p side=500.")
+@click.option('-o', '--output', type=click.Path(dir_okay=False, allow_dash=True), default='-',
+              show_default=True, help="Output file when generating a single day.")
+@click.option('-d', '--directory', type=click.Path(file_okay=False, path_type=Path),
+              help="Writes dayNN_<suffix>.txt files into this directory instead.")
+@click.option('-s', '--suffix', default='generated', show_default=True,
+              help="Input file suffix used with --directory.")
+def program(days, scale, seed, params, output, directory, suffix):
+    """Writes generated inputs for DAYS (all days by default).
+    """
+    knobs = {}
+    for param in params:
+        key, _, value = param.partition('=')
+        try:
+            knobs[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            knobs[key] = value
+
+    days = days or sorted(GENERATORS)
+    if directory is None and len(days) > 1:
+        raise click.UsageError("Use --directory to generate more than one day.")
+
+    for day in days:
+        text = generate(day, scale=scale, seed=seed, **knobs)
+        if directory is None:
+            with click.open_file(output, 'w') as fobj:
+                fobj.write(text)
+        else:
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / f'day{day:02d}_{suffix}.txt').write_text(text)
+
+
+def generate(day: int, scale: float = 1., seed: int = 2023, **knobs) -> str:
+    """Generates the input of a day. Knobs not understood by the day's
+    generator raise a TypeError.
+    """
+    rng = random.Random(seed * 100 + day)
+    return GENERATORS[day](rng, scale, **knobs)
+
+
+def scaled(value: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(value * scale))
+
+
+def names(rng: random.Random, count: int, length: int = 3,
+          alphabet: str = string.ascii_lowercase, exclude=()) -> list[str]:
+    """Returns `count` distinct random names, using longer names when there
+    are not enough names of the given length.
+    """
+    while len(alphabet) ** length < 2 * (count + len(exclude)):
+        length += 1
+    chosen = set(exclude)
+    result = []
+    while len(result) < count:
+        name = ''.join(rng.choices(alphabet, k=length))
+        if name not in chosen:
+            chosen.add(name)
+            result.append(name)
+    return result
+
+
+def name_stream(rng: random.Random, length: int = 2,
+                alphabet: str = string.ascii_lowercase, exclude=()):
+    """Yields distinct random names forever, getting longer as they run out.
+    """
+    chosen = set(exclude)
+    while True:
+        for _ in range(len(alphabet) ** length // 2):
+            name = ''.join(rng.choices(alphabet, k=length))
+            if name not in chosen:
+                chosen.add(name)
+                yield name
+        length += 1
+
+
+def spanning_loop(rng: random.Random, rows: int, cols: int,
+                  fill: float = 1.) -> list[tuple[int, int]]:
+    """Returns a random simple closed loop on a (2*rows)x(2*cols) grid as the
+    list of visited cells in order. The loop goes around a random spanning
+    tree of `fill` of the cells of a rows x cols grid.
+    """
+    start = (rng.randrange(rows), rng.randrange(cols))
+    tree, frontier = {start}, [(start, nb) for nb in _around(start, rows, cols)]
+    edges = set()
+    target = max(1, round(rows * cols * fill))
+    while frontier and len(tree) < target:
+        src, dest = frontier.pop(rng.randrange(len(frontier)))
+        if dest in tree:
+            continue
+        tree.add(dest)
+        edges.add((src, dest))
+        edges.add((dest, src))
+        frontier.extend((dest, nb) for nb in _around(dest, rows, cols) if nb not in tree)
+
+    # Every tree cell becomes a 2x2 block of fine cells linked in a square,
+    # except on the sides where the tree continues into the neighbor block.
+    links = {}
+    def link(a, b):
+        links.setdefault(a, []).append(b)
+        links.setdefault(b, []).append(a)
+
+    for r, c in tree:
+        tl, tr, bl, br = (2*r, 2*c), (2*r, 2*c+1), (2*r+1, 2*c), (2*r+1, 2*c+1)
+        if ((r-1, c), (r, c)) not in edges:
+            link(tl, tr)
+        if ((r+1, c), (r, c)) not in edges:
+            link(bl, br)
+        else:
+            link(bl, (2*r+2, 2*c))
+            link(br, (2*r+2, 2*c+1))
+        if ((r, c-1), (r, c)) not in edges:
+            link(tl, bl)
+        if ((r, c+1), (r, c)) not in edges:
+            link(tr, br)
+        else:
+            link(tr, (2*r, 2*c+2))
+            link(br, (2*r+1, 2*c+2))
+
+    first = min(links)
+    loop, prev = [first], None
+    while True:
+        cur = loop[-1]
+        nxt = next(cell for cell in links[cur] if cell != prev)
+        if nxt == first:
+            return loop
+        loop.append(nxt)
+        prev = cur
+
+
+def _around(cell, rows, cols):
+    r, c = cell
+    for nr, nc in ((r-1, c), (r+1, c), (r, c-1), (r, c+1)):
+        if 0 <= nr < rows and 0 <= nc < cols:
+            yield nr, nc
+
+
+def corners(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Keeps only the cells of a loop where it turns.
+    """
+    return [
+        cur for prev, cur, nxt in zip(loop[-1:] + loop[:-1], loop, loop[1:] + loop[:1])
+        if (cur[0] - prev[0], cur[1] - prev[1]) != (nxt[0] - cur[0], nxt[1] - cur[1])
+    ]
+
+
+@generator(1)
+def day01(rng, scale, lines=None, length=30):
+    words = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+    result = []
+    for _ in range(lines or scaled(1000, scale)):
+        chunks = [str(rng.randint(1, 9))]
+        while sum(map(len, chunks)) < rng.randint(length // 4, length):
+            match rng.random():
+                case p if p < .15:
+                    chunks.append(str(rng.randint(1, 9)))
+                case p if p < .35:
+                    chunks.append(rng.choice(words))
+                case _:
+                    chunks.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(chunks)
+        result.append(''.join(chunks))
+    return '\n'.join(result) + '\n'
+
+
+@generator(2)
+def day02(rng, scale, games=None, draws=6, max_cubes=20):
+    result = []
+    for game in range(1, (games or scaled(100, scale)) + 1):
+        subsets = []
+        for _ in range(rng.randint(1, draws)):
+            colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            subsets.append(", ".join(f"{rng.randint(1, max_cubes)} {color}" for color in colors))
+        result.append(f"Game {game}: " + "; ".join(subsets))
+    return '\n'.join(result) + '\n'
+
+
+@generator(3)
+def day03(rng, scale, side=None, numbers=.12, symbols=.015):
+    side = side or scaled(140 * math.sqrt(scale), 1, minimum=3)
+    grid = []
+    for _ in range(side):
+        row, col = [], 0
+        while col < side:
+            if rng.random() < numbers and col + 3 <= side:
+                number = str(rng.randint(1, 999))
+                row.append(number + '.')
+                col += len(number) + 1
+            else:
+                row.append(rng.choice('*#+$/=%@&-') if rng.random() < symbols else '.')
+                col += 1
+        grid.append(''.join(row)[:side])
+    return '\n'.join(grid) + '\n'
+
+
+@generator(4)
+def day04(rng, scale, cards=None, winning=10, having=25):
+    cards = cards or scaled(200, scale)
+    width = len(str(cards))
+    result = []
+    for card in range(1, cards + 1):
+        matches = min(rng.choice((0, 0, 0, 1, 1, 2, 3, 4, winning)), cards - card, winning)
+        wins = rng.sample(range(1, 100), winning)
+        numbers = wins[:matches] + rng.sample([n for n in range(1, 100) if n not in wins],
+                                              having - matches)
+        rng.shuffle(numbers)
+        result.append(f"Card {card:>{width}}: " + ' '.join(f'{n:2}' for n in wins) +
+                      " | " + ' '.join(f'{n:2}' for n in numbers))
+    return '\n'.join(result) + '\n'
+
+
+@generator(5)
+def day05(rng, scale, seeds=10, ranges=None, maps=7):
+    limit = 2**32
+    ranges = ranges or scaled(30, scale)
+    categories = ("seed", "soil", "fertilizer", "water", "light",
+                  "temperature", "humidity", "location")
+    categories += tuple(f"stage{i}" for i in range(len(categories), maps + 1))
+
+    seed_line = []
+    for _ in range(seeds):
+        start = rng.randrange(limit // 2)
+        seed_line += [start, rng.randrange(1, limit // (4 * seeds))]
+
+    result = ["seeds: " + ' '.join(map(str, seed_line))]
+    for src, dst in itertools.pairwise(categories[:maps + 1]):
+        cuts = sorted(rng.sample(range(1, limit), 2 * ranges))
+        lines = [f"{src}-to-{dst} map:"]
+        for start, end in zip(cuts[::2], cuts[1::2]):
+            lines.append(f"{rng.randrange(limit - (end - start))} {start} {end - start}")
+        result.append('\n'.join(lines))
+    return '\n\n'.join(result) + '\n'
+
+
+@generator(6)
+def day06(rng, scale, races=None):
+    races = races or scaled(4, scale)
+    times, dists = [], []
+    for _ in range(races):
+        time = rng.randint(7, 99)
+        times.append(time)
+        dists.append(rng.randint(time * time // 8, time * time // 4 - 1))
+    width = max(len(str(d)) for d in times + dists) + 2
+    return ("Time:    " + ''.join(f'{t:>{width}}' for t in times) + '\n' +
+            "Distance:" + ''.join(f'{d:>{width}}' for d in dists) + '\n')
+
+
+@generator(7)
+def day07(rng, scale, hands=None):
+    result = []
+    for _ in range(hands or scaled(1000, scale)):
+        result.append(''.join(rng.choices("23456789TJQKA", k=5)) + f" {rng.randint(1, 1000)}")
+    return '\n'.join(result) + '\n'
+
+
+@generator(8)
+def day08(rng, scale, ghosts=6, cycle=None, instructions=270):
+    """Every ghost walks a ring of nodes whose both branches lead to the next
+    node, so that the only node ending with 'Z' is reached every `cycle`-ish
+    steps, as `math.lcm` of the ghosts' steps expects.
+    """
+    cycle = cycle or scaled(100, scale, minimum=3)
+    lengths = [cycle + prime for prime in _primes(ghosts, start=cycle // 2 + 2)]
+    # Only the first and last node of a ring may end with 'A' or 'Z'.
+    labels = iter(names(rng, sum(lengths), alphabet=string.ascii_uppercase[1:25]))
+    prefixes = ["AA"] + names(rng, ghosts - 1, length=2, alphabet=string.ascii_uppercase,
+                              exclude=("AA", "ZZ"))
+
+    nodes = []
+    for prefix, length in zip(prefixes, lengths):
+        ring = [prefix + 'A'] + [next(labels) for _ in range(length - 2)]
+        ring.append("ZZZ" if prefix == "AA" else prefix + 'Z')
+        for cur, nxt in zip(ring, ring[1:] + ring[1:2]):
+            nodes.append(f"{cur} = ({nxt}, {nxt})")
+    rng.shuffle(nodes)
+    steps = ''.join(rng.choices("LR", k=instructions))
+    return steps + "\n\n" + '\n'.join(nodes) + '\n'
+
+
+def _primes(count: int, start: int = 2) -> list[int]:
+    primes, n = [], max(2, start)
+    while len(primes) < count:
+        if all(n % p for p in range(2, math.isqrt(n) + 1)):
+            primes.append(n)
+        n += 1
+    return primes
+
+
+@generator(9)
+def day09(rng, scale, histories=None, length=21, degree=None):
+    result = []
+    for _ in range(histories or scaled(200, scale)):
+        deg = degree if degree is not None else rng.randint(1, min(length - 2, 10))
+        coefs = [rng.randint(-5, 5) for _ in range(deg + 1)]
+        values = [sum(c * x**i for i, c in enumerate(coefs)) for x in range(length)]
+        result.append(' '.join(map(str, values)))
+    return '\n'.join(result) + '\n'
+
+
+PIPES = {
+    frozenset(((-1, 0), (1, 0))): '|',
+    frozenset(((0, -1), (0, 1))): '-',
+    frozenset(((-1, 0), (0, 1))): 'L',
+    frozenset(((-1, 0), (0, -1))): 'J',
+    frozenset(((1, 0), (0, -1))): '7',
+    frozenset(((1, 0), (0, 1))): 'F',
+}
+
+
+@generator(10)
+def day10(rng, scale, side=None, fill=.6, spacing=3, noise=.7):
+    """A single pipe loop around a random tree, stretched by `spacing` so that
+    it encloses tiles, surrounded by random junk pipes.
+    """
+    side = side or scaled(140 * math.sqrt(scale), 1, minimum=4 * spacing)
+    blocks = max(1, (side - 1) // (2 * spacing))
+    vertices = [(r * spacing, c * spacing) for r, c in corners(spanning_loop(rng, blocks, blocks, fill))]
+
+    grid = [[rng.choice('|-LJ7F') if rng.random() < noise else '.' for _ in range(side)]
+            for _ in range(side)]
+    loop = []
+    for (r1, c1), (r2, c2) in zip(vertices, vertices[1:] + vertices[:1]):
+        dr, dc = (r2 > r1) - (r2 < r1), (c2 > c1) - (c2 < c1)
+        loop.extend((r1 + i * dr, c1 + i * dc) for i in range(max(abs(r2 - r1), abs(c2 - c1))))
+    for prev, cur, nxt in zip(loop[-1:] + loop[:-1], loop, loop[1:] + loop[:1]):
+        dirs = frozenset(((prev[0] - cur[0], prev[1] - cur[1]), (nxt[0] - cur[0], nxt[1] - cur[1])))
+        grid[cur[0]][cur[1]] = PIPES[dirs]
+
+    # Junk pipes must not connect to the start tile.
+    sr, sc = rng.choice(loop)
+    grid[sr][sc] = 'S'
+    on_loop = set(loop)
+    for r, c in ((sr-1, sc), (sr+1, sc), (sr, sc-1), (sr, sc+1)):
+        if 0 <= r < side and 0 <= c < side and (r, c) not in on_loop:
+            grid[r][c] = '.'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+@generator(11)
+def day11(rng, scale, side=None, galaxies=None, empty=.05):
+    side = side or scaled(140 * math.sqrt(scale), 1, minimum=2)
+    galaxies = galaxies or scaled(440, scale)
+    rows = [r for r in range(side) if rng.random() >= empty] or [0]
+    cols = [c for c in range(side) if rng.random() >= empty] or [0]
+    galaxies = min(galaxies, len(rows) * len(cols))
+
+    grid = [['.'] * side for _ in range(side)]
+    placed = 0
+    while placed < galaxies:
+        r, c = rng.choice(rows), rng.choice(cols)
+        if grid[r][c] == '.':
+            grid[r][c] = '#'
+            placed += 1
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+@generator(12)
+def day12(rng, scale, records=None, length=20, unknown=.5):
+    result = []
+    for _ in range(records or scaled(1000, scale)):
+        size = rng.randint(length // 2, length)
+        springs = ['#' if rng.random() < .5 else '.' for _ in range(size)]
+        if '#' not in springs:
+            springs[rng.randrange(size)] = '#'
+        groups = [len(group) for group in ''.join(springs).split('.') if group]
+        masked = ''.join('?' if rng.random() < unknown else s for s in springs)
+        result.append(f"{masked} {','.join(map(str, groups))}")
+    return '\n'.join(result) + '\n'
+
+
+@generator(13)
+def day13(rng, scale, patterns=None, size=15):
+    """Every pattern mirrors around a random line, with one smudge flipped
+    somewhere in the reflected area.
+    """
+    result = []
+    for _ in range(patterns or scaled(100, scale)):
+        nrow, ncol = rng.randint(5, size), rng.randint(5, size)
+        vertical = rng.random() < .5
+        outer, inner = (ncol, nrow) if vertical else (nrow, ncol)
+        line = rng.randint(1, outer - 1)
+        lines = [[rng.choice('#.') for _ in range(inner)] for _ in range(outer)]
+        for i in range(min(line, outer - line)):
+            lines[line + i] = lines[line - 1 - i][:]
+        rows = [''.join(r) for r in (zip(*lines) if vertical else lines)]
+        r, c = rng.randrange(nrow), rng.randrange(ncol)
+        rows[r] = rows[r][:c] + ('#' if rows[r][c] == '.' else '.') + rows[r][c+1:]
+        result.append('\n'.join(rows))
+    return '\n\n'.join(result) + '\n'
+
+
+@generator(14)
+def day14(rng, scale, side=None, rocks=.2, cubes=.1):
+    side = side or scaled(100 * math.sqrt(scale), 1, minimum=2)
+    return '\n'.join(
+        ''.join(rng.choices('O#.', weights=(rocks, cubes, 1 - rocks - cubes), k=side))
+        for _ in range(side)
+    ) + '\n'
+
+
+@generator(15)
+def day15(rng, scale, steps=None, labels=None):
+    steps = steps or scaled(4000, scale)
+    labels = names(rng, labels or max(1, steps // 7), length=2)
+    return ','.join(
+        f"{label}-" if rng.random() < .3 else f"{label}={rng.randint(1, 9)}"
+        for label in (rng.choice(labels) for _ in range(steps))
+    ) + '\n'
+
+
+@generator(16)
+def day16(rng, scale, side=None, mirrors=.1):
+    side = side or scaled(110 * math.sqrt(scale), 1, minimum=2)
+    weights = (1 - mirrors,) + (mirrors / 4,) * 4
+    return '\n'.join(
+        ''.join(rng.choices('.|-/\\', weights=weights, k=side)) for _ in range(side)
+    ) + '\n'
+
+
+@generator(17)
+def day17(rng, scale, rows=None, cols=None):
+    rows = rows or scaled(141 * math.sqrt(scale), 1, minimum=2)
+    cols = cols or rows
+    return '\n'.join(''.join(rng.choices('123456789', k=cols)) for _ in range(rows)) + '\n'
+
+
+@generator(18)
+def day18(rng, scale, blocks=None, max_length=10):
+    """Both dig plans follow the same random loop, stretched with short edges
+    for part 1 and with the hexadecimal lengths of part 2.
+    """
+    blocks = blocks or scaled(12 * math.sqrt(scale), 1)
+    vertices = corners(spanning_loop(rng, blocks, blocks, fill=.7))
+    size = 2 * blocks + 1
+    fst = [list(itertools.accumulate(rng.randint(1, max_length) for _ in range(size)))
+           for _ in range(2)]
+    snd = [list(itertools.accumulate(rng.randint(1, 2**20 // size) for _ in range(size)))
+           for _ in range(2)]
+
+    result = []
+    directions = {(0, 1): ('R', 0), (1, 0): ('D', 1), (0, -1): ('L', 2), (-1, 0): ('U', 3)}
+    for (r1, c1), (r2, c2) in zip(vertices, vertices[1:] + vertices[:1]):
+        fst_dir, snd_dir = directions[(r2 > r1) - (r2 < r1), (c2 > c1) - (c2 < c1)]
+        fst_length = abs(fst[0][r2] - fst[0][r1]) + abs(fst[1][c2] - fst[1][c1])
+        snd_length = abs(snd[0][r2] - snd[0][r1]) + abs(snd[1][c2] - snd[1][c1])
+        result.append(f"{fst_dir} {fst_length} (#{snd_length:05x}{snd_dir})")
+    return '\n'.join(result) + '\n'
+
+
+@generator(19)
+def day19(rng, scale, depth=6, rules=4, parts=None):
+    """Workflows form a random tree of the given depth below 'in'.
+    """
+    workflows, labels = [], name_stream(rng, exclude=('in',))
+    stack = [('in', 0)]
+    while stack:
+        name, level = stack.pop()
+        targets = []
+        for _ in range(rng.randint(1, rules) + 1):
+            if level + 1 < depth and rng.random() < .6:
+                targets.append(next(labels))
+                stack.append((targets[-1], level + 1))
+            else:
+                targets.append(rng.choice('AR'))
+        *targets, default = targets
+        conditions = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{target}"
+                      for target in targets]
+        workflows.append(f"{name}{{{','.join(conditions + [default])}}}")
+    rng.shuffle(workflows)
+
+    ratings = [
+        "{" + ','.join(f"{key}={rng.randint(1, 4000)}" for key in 'xmas') + "}"
+        for _ in range(parts or scaled(200, scale))
+    ]
+    return '\n'.join(workflows) + "\n\n" + '\n'.join(ratings) + '\n'
+
+
+@generator(20)
+def day20(rng, scale, counters=4, bits=12):
+    """Binary counters driven by the broadcaster, each resetting through a
+    conjunction when it reaches a random period, as the puzzle's network does.
+    """
+    labels = iter(names(rng, counters * (bits + 2) + 1, length=2))
+    final = next(labels)
+    modules = [f"&{final} -> rx"]
+    broadcast = []
+    for _ in range(counters):
+        period = rng.randrange(2**(bits - 1) + 1, 2**bits, 2)
+        flipflops = [next(labels) for _ in range(bits)]
+        hub, inverter = next(labels), next(labels)
+        feedback = []
+        for bit, ff in enumerate(flipflops):
+            dests = flipflops[bit+1:bit+2]
+            if period >> bit & 1:
+                dests.append(hub)
+            if not period >> bit & 1 or bit == 0:
+                feedback.append(ff)
+            modules.append(f"%{ff} -> {', '.join(dests)}")
+        modules.append(f"&{hub} -> {', '.join(feedback + [inverter])}")
+        modules.append(f"&{inverter} -> {final}")
+        broadcast.append(flipflops[0])
+    modules.append(f"broadcaster -> {', '.join(broadcast)}")
+    rng.shuffle(modules)
+    return '\n'.join(modules) + '\n'
+
+
+@generator(21)
+def day21(rng, scale, side=None, rocks=.15):
+    """The start sits in the middle of an empty row and column, which the
+    quadratic extrapolation of part 2 relies on.
+    """
+    side = side or scaled(131 * math.sqrt(scale), 1, minimum=3) | 1
+    middle = side // 2
+    grid = [['#' if rng.random() < rocks else '.' for _ in range(side)] for _ in range(side)]
+    for i in range(side):
+        grid[middle][i] = grid[i][middle] = '.'
+        grid[0][i] = grid[-1][i] = grid[i][0] = grid[i][-1] = '.'
+    grid[middle][middle] = 'S'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+@generator(22)
+def day22(rng, scale, bricks=None, width=10, height=320, max_length=4):
+    """Non-overlapping bricks inside a width x width x height box.
+    """
+    bricks = bricks or scaled(1200, scale)
+    occupied, result = set(), []
+    while len(result) < bricks:
+        x, y, z = rng.randrange(width), rng.randrange(width), rng.randint(1, height)
+        axis, length = rng.randrange(3), rng.randint(1, max_length)
+        end = [x, y, z]
+        end[axis] = min(end[axis] + length - 1, (width - 1, width - 1, height)[axis])
+        cells = set(itertools.product(range(x, end[0] + 1), range(y, end[1] + 1), range(z, end[2] + 1)))
+        if cells.isdisjoint(occupied):
+            occupied |= cells
+            result.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+    return '\n'.join(result) + '\n'
+
+
+@generator(23)
+def day23(rng, scale, junctions=6, corridor=None):
+    """A square lattice of junctions joined by corridors whose slopes only
+    lead right and down, as in the puzzle's maze.
+    """
+    corridor = corridor or scaled(22 * math.sqrt(scale), 1, minimum=4)
+    offset = corridor // 2
+    side = 2 * offset + corridor * (junctions - 1) + 1
+    grid = [['#'] * side for _ in range(side)]
+    position = lambda i: offset + i * corridor
+
+    for i in range(offset + 1):
+        grid[i][offset] = '.'
+        grid[side - 1 - i][position(junctions - 1)] = '.'
+    for i, j in itertools.product(range(junctions), repeat=2):
+        r, c = position(i), position(j)
+        grid[r][c] = '.'
+        if j + 1 < junctions:
+            for k in range(1, corridor):
+                grid[r][c + k] = '.'
+            grid[r][c + 1] = grid[r][c + corridor - 1] = '>'
+        if i + 1 < junctions:
+            for k in range(1, corridor):
+                grid[r + k][c] = '.'
+            grid[r + 1][c] = grid[r + corridor - 1][c] = 'v'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+@generator(24)
+def day24(rng, scale, hailstones=None):
+    """Hailstones are placed so that one rock thrown from an integer position
+    with an integer velocity hits all of them at distinct integer times.
+    """
+    hailstones = hailstones or scaled(300, scale)
+    rock = [rng.randint(1 * 10**14, 4 * 10**14) for _ in range(3)]
+    velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**11, 10**12), hailstones)
+
+    result = []
+    for t in times:
+        while (vel := [rng.randint(-500, 500) for _ in range(3)]) == velocity:
+            pass
+        pos = [p + (v - u) * t for p, v, u in zip(rock, velocity, vel)]
+        result.append(f"{', '.join(map(str, pos))} @ {', '.join(map(str, vel))}")
+    return '\n'.join(result) + '\n'
+
+
+@generator(25)
+def day25(rng, scale, nodes=None, degree=4):
+    """Two random well-connected components joined by exactly three wires.
+    """
+    nodes = nodes or scaled(1500, scale, minimum=16)
+    labels = names(rng, nodes)
+    halves = labels[:nodes // 2], labels[nodes // 2:]
+
+    edges, seen, degrees = [], set(), dict.fromkeys(labels, 0)
+    def connect(u, v):
+        if u != v and (edge := frozenset((u, v))) not in seen:
+            seen.add(edge)
+            edges.append((u, v) if rng.random() < .5 else (v, u))
+            degrees[u] += 1
+            degrees[v] += 1
+
+    for half in halves:
+        for i, u in enumerate(half):
+            connect(u, half[i - 1])
+            while degrees[u] < degree:
+                connect(u, rng.choice(half))
+    for u, v in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        connect(u, v)
+
+    wires = {}
+    for u, v in edges:
+        wires.setdefault(u, []).append(v)
+    return '\n'.join(f"{u}: {' '.join(vs)}" for u, vs in wires.items()) + '\n'
+
+
+if __name__ == '__main__':
+    program()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from typing import Any
+
+CACHE_DIR = os.environ.get(
+    'AOC_CACHE_DIR',
+    os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'aoc2023-python'),
+)
+MAX_BYTES = int(os.environ.get('AOC_CACHE_MAX_BYTES', 512 * 2**20))
+MAX_ANSWERS = int(os.environ.get('AOC_ANSWERS_MAX_ENTRIES', 100_000))
+MAX_AGE = float(os.environ.get('AOC_ANSWERS_MAX_AGE', 30 * 24 * 3600))
+
+# Set by the command line programs; solvers called as a library do not cache.
+ACTIVE: ParseCache | None = None
+ANSWERS: AnswerStore | None = None
+
+
+class ParseCache:
+    """Pickled parsed puzzles stored in a directory, keyed by a hash of the
+    solver version and the input bytes. The least recently used entries are
+    evicted once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.directory = os.path.join(directory, 'parse')
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(day: int, version: str, data: str | bytes) -> str:
+        digest = hashlib.sha256(version.encode())
+        digest.update(data.encode() if isinstance(data, str) else data)
+        return f'day{day:02d}-{digest.hexdigest()}'
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Returns (True, puzzle) on a hit and (False, None) on a miss.
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as fobj:
+                puzzle = pickle.load(fobj)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.discard(key)
+            return False, None
+
+        os.utime(path)  # mark as recently used
+        return True, puzzle
+
+    def put(self, key: str, puzzle: Any) -> None:
+        """Stores a puzzle, silently skipping puzzles that cannot be pickled.
+        """
+        try:
+            data = pickle.dumps(puzzle, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        import tempfile
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fobj:
+            fobj.write(data)
+        os.replace(tmp, self.path(key))
+        self.evict()
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits.
+        """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.pickle'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class AnswerStore:
+    """Answers stored in a SQLite database under the cache directory, keyed by
+    (day, SHA-256 of the input, part, solver version). Entries older than
+    `max_age` seconds are ignored and the least recently used ones are evicted
+    beyond `max_entries`.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_entries: int = MAX_ANSWERS,
+                 max_age: float = MAX_AGE):
+        self.path = os.path.join(directory, 'answers.sqlite3')
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._db = None
+
+    @staticmethod
+    def digest(data: str | bytes) -> str:
+        return hashlib.sha256(data.encode() if isinstance(data, str) else data).hexdigest()
+
+    @property
+    def db(self):
+        if self._db is None:
+            import sqlite3
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    day INTEGER, digest TEXT, part INTEGER, version TEXT,
+                    answer BLOB, created REAL, accessed REAL,
+                    PRIMARY KEY (day, digest, part, version)
+                )
+            """)
+        return self._db
+
+    def get(self, day: int, digest: str, part: int, version: str) -> tuple[bool, Any]:
+        """Returns (True, answer) on a hit and (False, None) on a miss.
+        """
+        import time
+
+        key = (day, digest, part, version)
+        row = self.db.execute(
+            "SELECT answer, created FROM answers "
+            "WHERE day = ? AND digest = ? AND part = ? AND version = ?", key
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        answer, created = row
+        if (now := time.time()) - created > self.max_age:
+            self.db.execute("DELETE FROM answers WHERE day = ? AND digest = ? AND part = ? "
+                            "AND version = ?", key)
+            return False, None
+
+        self.db.execute("UPDATE answers SET accessed = ? WHERE day = ? AND digest = ? "
+                        "AND part = ? AND version = ?", (now, *key))
+        return True, pickle.loads(answer)
+
+    def put(self, day: int, digest: str, part: int, version: str, answer: Any) -> None:
+        import time
+
+        try:
+            data = pickle.dumps(answer, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        now = time.time()
+        self.db.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (day, digest, part, version, data, now, now))
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes expired entries, then the least recently used ones until
+        the store fits.
+        """
+        import time
+
+        self.db.execute("DELETE FROM answers WHERE created < ?", (time.time() - self.max_age,))
+        self.db.execute(
+            "DELETE FROM answers WHERE rowid IN "
+            "(SELECT rowid FROM answers ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+
+def enable(directory: str = CACHE_DIR, max_bytes: int = MAX_BYTES,
+           max_answers: int = MAX_ANSWERS, max_age: float = MAX_AGE) -> None:
+    """Makes every registered solution cache its parsed puzzles and answers.
+    """
+    global ACTIVE, ANSWERS
+    ACTIVE = ParseCache(directory, max_bytes)
+    ANSWERS = AnswerStore(directory, max_answers, max_age)
+
+
+def disable() -> None:
+    global ACTIVE, ANSWERS
+    ACTIVE = ANSWERS = None
@@ -1,19 +1,158 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import sys
 
-import click
-
 
 def command_with_input_file(func):
     """Inserts input file argument to a click's command.
+    The command is built on its first call, so that importing a day module
+    does not import click. A `--stream` flag is added when the function takes
+    a `stream` argument.
+    """
+    @functools.cache
+    def command():
+        import click
+
+        code = func.__code__
+        if 'stream' in code.co_varnames[:code.co_argcount]:
+            stream_option = click.option(
+                '--stream', is_flag=True,
+                help="Solves while reading the input, in constant memory.")
+        else:
+            stream_option = lambda main: main
+
+        @click.command()
+        @click.argument(
+            'input_file', default='-',
+            type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+        )
+        @click.option('--no-cache', is_flag=True, help="Do not use the on-disk caches.")
+        @click.option('--profile', type=click.Path(dir_okay=False),
+                      help="Writes a cProfile dump (readable by pstats) to this file.")
+        @click.option('--memory', is_flag=True,
+                      help="Reports the peak traced memory and the top allocation sites.")
+        @click.option('--timings', is_flag=True,
+                      help="Reports the time spent parsing and on each part.")
+        @click.option('--metrics', type=click.Choice(['json', 'prometheus']),
+                      help="Reports the solvers' work counters in this format.")
+        @stream_option
+        @functools.wraps(func)
+        def main(input_file, no_cache, profile, memory, timings, metrics, **options):
+            from helpers import cache
+
+            # Measurements are only meaningful when the work is really done.
+            if not (no_cache or profile or memory or timings or metrics):
+                cache.enable()
+
+            with contextlib.ExitStack() as stack:
+                if timings:
+                    stack.enter_context(report_timings())
+                if memory:
+                    stack.enter_context(report_memory())
+                if profile:
+                    stack.enter_context(write_profile(profile))
+                if metrics:
+                    stack.enter_context(report_metrics(metrics))
+                return func(input_file, **options)
+
+        return main
+
+    @functools.wraps(func)
+    def program(*args, **kwargs):
+        return command()(*args, **kwargs)
+
+    program.command = command
+    return program
+
+
+@contextlib.contextmanager
+def report_timings():
+    """Prints the parse, part 1 and part 2 durations of every solution run
+    inside the context to stderr.
     """
-    arg = click.argument(
-        'input_file', default='-',
-        type=click.Path(exists=True, dir_okay=False, allow_dash=True),
-    )
-    return click.command(arg(func))
+    from helpers import registry
+
+    def observer(solution, result):
+        print(f"Day {solution.day:02d} timings:", file=sys.stderr)
+        for phase, elapsed in result.timings.items():
+            print(f"  {phase:<6} {elapsed:10.6f}s", file=sys.stderr)
+
+    registry.OBSERVERS.append(observer)
+    try:
+        yield
+    finally:
+        registry.OBSERVERS.remove(observer)
+
+
+@contextlib.contextmanager
+def report_metrics(fmt: str = 'json'):
+    """Collects metrics inside the context, including the parse and part
+    durations of every solution run, then prints them to stderr as JSON or in
+    the Prometheus text format.
+    """
+    import json
+
+    from helpers import metrics, registry
+
+    def observer(solution, result):
+        for phase, elapsed in result.timings.items():
+            collected.observe(f'day{solution.day:02d}_{phase}', elapsed)
+
+    collected = metrics.enable()
+    registry.OBSERVERS.append(observer)
+    try:
+        yield
+    finally:
+        registry.OBSERVERS.remove(observer)
+        metrics.disable()
+        if fmt == 'prometheus':
+            sys.stderr.write(collected.to_prometheus())
+        else:
+            print(json.dumps(collected.to_json(), indent=2), file=sys.stderr)
+
+
+@contextlib.contextmanager
+def report_memory(top: int = 10):
+    """Traces allocations inside the context, then prints the peak traced
+    memory and the `top` allocation sites still alive to stderr.
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ))
+        print(f"Peak traced memory: {peak / 2**20:.2f} MiB", file=sys.stderr)
+        for stat in snapshot.statistics('lineno')[:top]:
+            print(f"  {stat}", file=sys.stderr)
+
+
+@contextlib.contextmanager
+def write_profile(path: str, top: int = 20):
+    """Profiles the context with cProfile, dumps the stats to `path` and prints
+    the `top` functions by cumulative time to stderr.
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(top)
 
 
 def open_input_file(file):
@@ -25,3 +164,61 @@ def open_input_file(file):
         return contextlib.nullcontext(sys.stdin)
     return open(file)
 
+
+@contextlib.contextmanager
+def open_input_bytes(file):
+    """Like `open_input_file()` but for bytes: a file is memory-mapped read-only,
+    so that it can be indexed and sliced without reading it into memory, while
+    the standard input is returned as a binary stream to read from sequentially.
+    Either can be passed to `iter_lines()` and `iter_records()`.
+    """
+    if not file or file == '-':
+        yield sys.stdin.buffer
+        return
+
+    import mmap
+
+    with open(file, 'rb') as fobj:
+        try:
+            data = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            yield b''
+            return
+        with data:
+            yield data
+
+
+def iter_lines(source):
+    """Yields the lines of a buffer, e.g. a mapped file, or the lines read from
+    a binary stream one at a time, as bytes with their line endings stripped.
+    Only the current line is copied out of the buffer, and lines can be kept
+    after leaving `open_input_bytes()`.
+    """
+    if not hasattr(source, 'find'):
+        for line in source:
+            yield line.rstrip(b'\r\n')
+        return
+
+    start, end = 0, len(source)
+    while start < end:
+        stop = source.find(b'\n', start)
+        if stop < 0:
+            stop = end
+        yield source[start:stop - 1] if stop > start and source[stop - 1] == 13 else source[start:stop]
+        start = stop + 1
+
+
+def iter_records(source):
+    """Yields the blank-line separated records of a buffer or a binary stream,
+    each as a list of lines (see `iter_lines()`).
+    """
+    record = []
+    for line in iter_lines(source):
+        if len(line):
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
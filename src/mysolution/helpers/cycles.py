@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Callable, Hashable, Iterable, TypeVar
+
+State = TypeVar('State')
+
+
+def brent(start: State, step: Callable[[State], State],
+          key: Callable[[State], Hashable] = lambda state: state) -> tuple[int, int]:
+    """Finds the cycle of the sequence start, step(start), ... with Brent's
+    algorithm, holding only two states at a time. Returns (prefix, period):
+    the state after `prefix` steps is the first one to repeat, `period` steps
+    later. States are compared by `key`, which must be exact.
+    """
+    power = period = 1
+    tortoise, hare = start, step(start)
+    while key(tortoise) != key(hare):
+        if power == period:
+            tortoise, power, period = hare, power * 2, 0
+        hare = step(hare)
+        period += 1
+
+    tortoise = hare = start
+    for _ in range(period):
+        hare = step(hare)
+    prefix = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        prefix += 1
+    return prefix, period
+
+
+def find_cycle(start: State, step: Callable[[State], State],
+               key: Callable[[State], Hashable] = hash) -> tuple[int, int]:
+    """Finds the cycle of the sequence start, step(start), ... taking each step
+    once, while storing only the `key` of every state seen, e.g. a hash
+    fingerprint. A repeated key is verified by replaying the sequence from
+    `start`, so fingerprint collisions cannot give a wrong cycle. Returns
+    (prefix, period) like `brent()`.
+    """
+    prefix, period, _ = _find_cycle(start, step, key)
+    return prefix, period
+
+
+def nth_state(start: State, step: Callable[[State], State], n: int,
+              key: Callable[[State], Hashable] = hash) -> State:
+    """Returns the state after `n` steps, skipping whole periods once the
+    cycle is found.
+    """
+    prefix, period, state = _find_cycle(start, step, key, limit=n)
+    if prefix + period > n:
+        return state  # reached step n before a cycle was found
+    for _ in range((n - prefix) % period):
+        state = step(state)
+    return state
+
+
+def event_times(start: State, step: Callable[[State], State], is_event: Callable[[State], bool],
+                key: Callable[[State], Hashable] = hash) -> tuple[set[int], int, int, list[int]]:
+    """Finds when the sequence start, step(start), ... is at a state where
+    `is_event` holds. Returns (events, prefix, period, residues): the times
+    below `prefix` are in `events`, and a time `t >= prefix` is an event time
+    when `t % period` is in `residues`. The cycle is found with
+    `find_cycle()`, then replayed once to collect the events.
+    """
+    prefix, period = find_cycle(start, step, key)
+    events, residues, state = set(), [], start
+    for t in range(prefix + period):
+        if is_event(state):
+            if t < prefix:
+                events.add(t)
+            else:
+                residues.append(t % period)
+        state = step(state)
+    return events, prefix, period, residues
+
+
+def first_common_time(times: Iterable[tuple[set[int], int, int, list[int]]], start: int = 1) -> int | None:
+    """Returns the first time from `start` on that is an event time of every
+    sequence, given their `event_times()`, or None if there is none. Times
+    before every sequence is in its cycle are checked one by one, later ones
+    by the Chinese remainder theorem.
+    """
+    times = list(times)
+
+    def is_event(t, events, prefix, period, residues):
+        return t in events if t < prefix else t % period in residues
+
+    cycles_start = max(start, *(prefix for _, prefix, _, _ in times))
+    for t in range(start, cycles_start):
+        if all(is_event(t, *sequence) for sequence in times):
+            return t
+
+    best = None
+    congruences = [_shortest_period(period, residues) for _, _, period, residues in times]
+    for choice in itertools.product(*(residues for _, residues in congruences)):
+        a, m = 0, 1
+        for r, (period, _) in zip(choice, congruences):
+            g = math.gcd(m, period)
+            if (r - a) % g:
+                break
+            a += m * ((r - a) // g * pow(m // g, -1, period // g) % (period // g))
+            m = m * period // g
+        else:
+            t = a + (cycles_start - a + m - 1) // m * m  # smallest t >= cycles_start
+            best = t if best is None else min(best, t)
+    return best
+
+
+def _shortest_period(period: int, residues: list[int]) -> tuple[int, list[int]]:
+    """Returns the smallest divisor `d` of `period` such that the residues
+    repeat every `d`, with the residues modulo `d`, so that fewer
+    combinations of residues go through the Chinese remainder theorem.
+    """
+    residues = set(residues)
+    divisors = sorted({d for k in range(1, math.isqrt(period) + 1) if period % k == 0
+                       for d in (k, period // k)})
+    for d in divisors:
+        if all((r + d) % period in residues for r in residues):
+            return d, sorted({r % d for r in residues})
+    return period, sorted(residues)
+
+
+def _find_cycle(start, step, key, limit=None):
+    """Returns (prefix, period, state after `prefix` steps). With a `limit`,
+    gives up at step `limit`, returning (limit, 1, state after `limit` steps).
+    """
+    seen = {}
+    state, i = start, 0
+    while limit is None or i < limit:
+        fingerprint = key(state)
+        if (indices := seen.get(fingerprint)) is None:
+            seen[fingerprint] = i
+        else:
+            # Only colliding fingerprints keep a tuple of indices.
+            indices = indices if isinstance(indices, tuple) else (indices,)
+            for j in indices:
+                earlier = start
+                for _ in range(j):
+                    earlier = step(earlier)
+                if earlier == state:
+                    return j, i - j, earlier
+            seen[fingerprint] = (*indices, i)
+        state, i = step(state), i + 1
+    return i, 1, state
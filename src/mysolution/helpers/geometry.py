@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def shoelace(xs: Sequence[int] | np.ndarray, ys: Sequence[int] | np.ndarray) -> int:
+    """Returns twice the area of the simple polygon with the given vertex
+    coordinates, as an exact integer. NumPy integer arrays are summed
+    vectorized in int64 when no sum of products can overflow it, and with
+    Python ints otherwise, like other sequences.
+    """
+    if hasattr(xs, 'dtype'):
+        import numpy as np
+
+        bound = max(int(abs(xs).max()), int(abs(ys).max())) if len(xs) else 0
+        if 2 * len(xs) * bound * bound < 2**63:
+            xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+            return abs(int(np.dot(xs, np.roll(ys, -1)) - np.dot(np.roll(xs, -1), ys)))
+        xs, ys = xs.tolist(), ys.tolist()
+
+    return abs(sum(xs[i-1]*ys[i] - xs[i]*ys[i-1] for i in range(len(xs))))
+
+
+def boundary_points(xs: Sequence[int], ys: Sequence[int]) -> int:
+    """Counts the lattice points on the boundary of the polygon.
+    """
+    return sum(math.gcd(xs[i] - xs[i-1], ys[i] - ys[i-1]) for i in range(len(xs)))
+
+
+def interior_points(twice_area: int, boundary: int) -> int:
+    """Counts the lattice points strictly inside a lattice polygon, by Pick's
+    theorem A = I + B/2 - 1.
+    """
+    return (twice_area - boundary + 2) // 2
+
+
+class Shoelace:
+    """Accumulates twice the area and the boundary lattice points of a polygon
+    whose vertices are added one at a time, in constant memory.
+    """
+
+    def __init__(self, vertices: Iterable[tuple[int, int]] = ()):
+        self.first = self.last = None
+        self.cross = 0
+        self.boundary = 0
+        for x, y in vertices:
+            self.add(x, y)
+
+    def add(self, x: int, y: int) -> None:
+        if self.last is None:
+            self.first = (x, y)
+        else:
+            px, py = self.last
+            self.cross += px*y - x*py
+            self.boundary += math.gcd(x - px, y - py)
+        self.last = (x, y)
+
+    def _closing(self) -> tuple[int, int]:
+        """The cross product and boundary points of the closing edge.
+        """
+        if self.last is None:
+            return 0, 0
+        (x, y), (px, py) = self.first, self.last
+        return px*y - x*py, math.gcd(x - px, y - py)
+
+    @property
+    def twice_area(self) -> int:
+        return abs(self.cross + self._closing()[0])
+
+    @property
+    def boundary_points(self) -> int:
+        return self.boundary + self._closing()[1]
+
+    @property
+    def interior_points(self) -> int:
+        return interior_points(self.twice_area, self.boundary_points)
+
+    @property
+    def lattice_points(self) -> int:
+        """Counts the lattice points inside or on the boundary.
+        """
+        return self.interior_points + self.boundary_points
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import dataclasses
+from array import array
+from collections import deque
+from functools import cached_property
+from typing import Hashable, Iterable, Iterator, Self
+
+
+class Interner:
+    """Assigns consecutive integer ids to names in order of first appearance.
+    """
+
+    def __init__(self, names: Iterable[Hashable] = ()):
+        self.ids: dict[Hashable, int] = {}
+        self.names: list[Hashable] = []
+        for name in names:
+            self(name)
+
+    def __call__(self, name: Hashable) -> int:
+        if (node := self.ids.get(name)) is None:
+            node = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return node
+
+    def __len__(self):
+        return len(self.names)
+
+
+@dataclasses.dataclass(frozen=True)
+class Graph:
+    """A directed graph in compressed sparse row form: the edges leaving node
+    `u` are `offsets[u]` to `offsets[u+1]`, going to `targets[e]` with weight
+    `weights[e]`, in the order they were added. Nodes are the ints 0..n-1 and
+    `names` maps them back to the labels they were interned from.
+    """
+    offsets: array
+    targets: array
+    weights: array | None
+    names: list[Hashable]
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple], nodes: Iterable[Hashable] = (),
+                   undirected: bool = False) -> Self:
+        """Builds a graph from (u, v) or (u, v, weight) tuples of names. The
+        `nodes` are interned first, so they get the lowest ids in that order
+        even without edges. Undirected edges are stored in both directions.
+        """
+        intern = Interner(nodes)
+        sources, targets, weights = array('l'), array('l'), array('q')
+        for edge in edges:
+            u, v = intern(edge[0]), intern(edge[1])
+            weight = edge[2] if len(edge) > 2 else 1
+            sources.append(u)
+            targets.append(v)
+            weights.append(weight)
+            if undirected:
+                sources.append(v)
+                targets.append(u)
+                weights.append(weight)
+
+        # Counting sort by source, stable so that each node keeps its edge order.
+        n = len(intern)
+        offsets = array('l', bytes(array('l').itemsize * (n + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        slots = offsets[:-1]
+        sorted_targets = array('l', bytes(targets.itemsize * len(targets)))
+        sorted_weights = array('q', bytes(weights.itemsize * len(weights)))
+        for u, v, weight in zip(sources, targets, weights):
+            e = slots[u]
+            slots[u] += 1
+            sorted_targets[e], sorted_weights[e] = v, weight
+
+        return cls(offsets=offsets, targets=sorted_targets,
+                   weights=sorted_weights if any(w != 1 for w in weights) else None,
+                   names=intern.names)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @cached_property
+    def ids(self) -> dict[Hashable, int]:
+        return {name: node for node, name in enumerate(self.names)}
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def successors(self, u: int) -> array:
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def edges(self, u: int) -> Iterator[tuple[int, int]]:
+        """Yields (target, weight) of the edges leaving `u`.
+        """
+        start, stop = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            for e in range(start, stop):
+                yield self.targets[e], 1
+        else:
+            for e in range(start, stop):
+                yield self.targets[e], self.weights[e]
+
+    def reversed(self) -> Graph:
+        """Returns the graph with every edge flipped and the same node ids.
+        """
+        flipped = Graph.from_edges(
+            (edge for u in range(len(self)) for edge in self._flipped_edges(u)),
+            nodes=range(len(self)),
+        )
+        return dataclasses.replace(flipped, names=self.names)
+
+    def _flipped_edges(self, u: int) -> Iterator[tuple[int, int, int]]:
+        for v, weight in self.edges(u):
+            yield v, u, weight
+
+
+def bfs(graph: Graph, sources: Iterable[int]) -> list[int]:
+    """Returns the number of edges from the nearest source to every node, -1
+    for unreachable nodes.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    dist = [-1] * len(graph)
+    queue = deque()
+    for s in sources:
+        dist[s] = 0
+        queue.append(s)
+    while queue:
+        u = queue.popleft()
+        for e in range(offsets[u], offsets[u + 1]):
+            if dist[v := targets[e]] < 0:
+                dist[v] = dist[u] + 1
+                queue.append(v)
+    return dist
+
+
+def dfs(graph: Graph, source: int) -> Iterator[int]:
+    """Yields the nodes reachable from `source` in depth-first preorder.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    seen = bytearray(len(graph))
+    stack = [source]
+    while stack:
+        u = stack.pop()
+        if seen[u]:
+            continue
+        seen[u] = 1
+        yield u
+        # Reversed so that the first edge is explored first.
+        stack.extend(v for v in reversed(targets[offsets[u]:offsets[u + 1]]) if not seen[v])
+
+
+def topological_order(graph: Graph) -> list[int]:
+    """Orders the nodes so that every edge goes forward (Kahn's algorithm).
+    Raises ValueError if the graph has a cycle.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    indegree = [0] * len(graph)
+    for v in targets:
+        indegree[v] += 1
+
+    order = [u for u in range(len(graph)) if not indegree[u]]
+    for u in order:
+        for e in range(offsets[u], offsets[u + 1]):
+            indegree[v := targets[e]] -= 1
+            if not indegree[v]:
+                order.append(v)
+
+    if len(order) != len(graph):
+        raise ValueError("The graph has a cycle.")
+    return order
+
+
+def connected_components(graph: Graph) -> list[list[int]]:
+    """Lists the nodes of every component, following edges in both
+    directions of an undirected graph (for a directed graph, only forward).
+    """
+    labels = [-1] * len(graph)
+    components = []
+    for s in range(len(graph)):
+        if labels[s] < 0:
+            components.append(list(_label_component(graph, s, labels, len(components))))
+    return components
+
+
+def _label_component(graph: Graph, source: int, labels: list[int], label: int) -> Iterator[int]:
+    offsets, targets = graph.offsets, graph.targets
+    labels[source] = label
+    stack = [source]
+    while stack:
+        u = stack.pop()
+        yield u
+        for e in range(offsets[u], offsets[u + 1]):
+            if labels[v := targets[e]] < 0:
+                labels[v] = label
+                stack.append(v)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import dataclasses
+import re
+from typing import TYPE_CHECKING, Iterator, Self
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (row, column) steps to the four orthogonal neighbors.
+UP, DOWN, LEFT, RIGHT = (-1, 0), (1, 0), (0, -1), (0, 1)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+
+@dataclasses.dataclass(frozen=True)
+class Grid:
+    """A rectangular grid of characters stored row-major in one contiguous
+    bytes buffer, one uint8 per cell. Cell (r, c) is at the flat index
+    `r * ncol + c`, and reading `cells[i]` gives the character code as an int.
+    `array` views the same memory as a (nrow, ncol) NumPy array.
+    """
+    cells: bytes
+    nrow: int
+    ncol: int
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
+        """Parses the lines of a grid, e.g. a puzzle input read in binary mode
+        or mapped with `helpers.cli.open_input_bytes()`. Blank lines are
+        skipped, and the rows are copied out of the buffer only once, into
+        the cells.
+        """
+        spans = [m.span() for m in re.finditer(rb'[^\r\n]+', data)]
+        ncol = spans[0][1] - spans[0][0] if spans else 0
+        if any(stop - start != ncol for start, stop in spans):
+            raise ValueError("Grid rows must all have the same length.")
+        # Released on return, so that a mapped file can be closed.
+        with memoryview(data) as view:
+            cells = b''.join([view[start:stop] for start, stop in spans])
+        return cls(cells=cells, nrow=len(spans), ncol=ncol)
+
+    @classmethod
+    def from_str(cls, s: str) -> Self:
+        return cls.from_bytes(s.encode())
+
+    def __str__(self):
+        return '\n'.join(row.decode() for row in self.rows())
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, pos: tuple[int, int]) -> int:
+        r, c = pos
+        return self.cells[r * self.ncol + c]
+
+    @property
+    def array(self) -> np.ndarray:
+        import numpy as np
+
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.nrow, self.ncol)
+
+    def rows(self) -> Iterator[bytes]:
+        ncol = self.ncol
+        for start in range(0, len(self.cells), ncol):
+            yield self.cells[start:start + ncol]
+
+    def index(self, r: int, c: int) -> int:
+        return r * self.ncol + c
+
+    def position(self, i: int) -> tuple[int, int]:
+        return divmod(i, self.ncol)
+
+    def find(self, char: bytes) -> int:
+        """Returns the flat index of the first cell holding `char`.
+        """
+        return self.cells.index(char)
+
+    def step(self, i: int, dr: int, dc: int) -> int | None:
+        """Returns the flat index of the cell (dr, dc) away from cell `i`, or
+        None when it falls outside the grid.
+        """
+        r, c = divmod(i, self.ncol)
+        if 0 <= (r := r + dr) < self.nrow and 0 <= (c := c + dc) < self.ncol:
+            return r * self.ncol + c
+        return None
+
+    def neighbors(self, i: int) -> Iterator[int]:
+        """Yields the flat indices of the orthogonal neighbors of cell `i`
+        that are inside the grid.
+        """
+        ncol = self.ncol
+        r, c = divmod(i, ncol)
+        if r > 0:
+            yield i - ncol
+        if r < self.nrow - 1:
+            yield i + ncol
+        if c > 0:
+            yield i - 1
+        if c < ncol - 1:
+            yield i + 1
+
+    def padded(self, fill: bytes = b'\0') -> Grid:
+        """Returns the grid surrounded by a one cell border of `fill`, so that
+        hot loops can step with `i ± 1` and `i ± ncol` and detect the edge by
+        reading the border instead of checking bounds.
+        """
+        ncol = self.ncol + 2
+        border = fill * ncol
+        cells = b''.join([border, *(fill + row + fill for row in self.rows()), border])
+        return Grid(cells=cells, nrow=self.nrow + 2, ncol=ncol)
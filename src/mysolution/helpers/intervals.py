@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import dataclasses
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterable, Iterator, Self
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclasses.dataclass(frozen=True)
+class IntervalSet:
+    """A set of integers stored as sorted, disjoint and non-adjacent half-open
+    intervals, flattened into `bounds = (start0, stop0, start1, stop1, ...)`.
+    An integer is in the set when an odd number of bounds are <= it.
+    """
+    bounds: tuple[int, ...] = ()
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[tuple[int, int]]) -> Self:
+        """Builds the union of (start, stop) intervals, ignoring empty ones.
+        """
+        bounds = []
+        for start, stop in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], stop)
+            else:
+                bounds += [start, stop]
+        return cls(tuple(bounds))
+
+    @classmethod
+    def range(cls, start: int, stop: int) -> Self:
+        return cls((start, stop) if start < stop else ())
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Yields the (start, stop) intervals in increasing order.
+        """
+        it = iter(self.bounds)
+        return zip(it, it)
+
+    def __contains__(self, x: int) -> bool:
+        return bisect_right(self.bounds, x) & 1 == 1
+
+    def __bool__(self):
+        return bool(self.bounds)
+
+    @property
+    def size(self) -> int:
+        """The number of integers in the set.
+        """
+        return sum(stop - start for start, stop in self)
+
+    @property
+    def min(self) -> int:
+        return self.bounds[0]
+
+    def clip(self, start: int, stop: int) -> IntervalSet:
+        """Intersects with a single interval, looking only at the bounds
+        inside it.
+        """
+        if start >= stop:
+            return IntervalSet()
+        lo, hi = bisect_right(self.bounds, start), bisect_left(self.bounds, stop)
+        bounds = self.bounds[lo:hi]
+        if lo & 1:
+            bounds = (start, *bounds)
+        if hi & 1:
+            bounds = (*bounds, stop)
+        return IntervalSet(bounds)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a and b)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a or b)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda a, b: a and not b)
+
+    def _combine(self, other: IntervalSet, op) -> IntervalSet:
+        """Sweeps the bounds of both sets, keeping the points where `op` of
+        the two memberships changes.
+        """
+        a, b = self.bounds, other.bounds
+        i = j = 0
+        inside, bounds = False, []
+        while i < len(a) or j < len(b):
+            x = min(a[i] if i < len(a) else b[j], b[j] if j < len(b) else a[i])
+            while i < len(a) and a[i] == x:
+                i += 1
+            while j < len(b) and b[j] == x:
+                j += 1
+            if op(i & 1 == 1, j & 1 == 1) != inside:
+                inside = not inside
+                bounds.append(x)
+        return IntervalSet(tuple(bounds))
+
+
+@dataclasses.dataclass(frozen=True)
+class PiecewiseMap:
+    """An integer function that translates each piece of the number line by
+    its own offset: x maps to `x + offsets[bisect_right(breaks, x)]`, so
+    `offsets` has one more entry than the sorted `breaks`. The identity is
+    `PiecewiseMap()`.
+    """
+    breaks: tuple[int, ...] = ()
+    offsets: tuple[int, ...] = (0,)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int, int]]) -> Self:
+        """Builds the map adding `offset` on each disjoint [start, stop) and
+        leaving other integers unchanged.
+        """
+        breaks, offsets = [], [0]
+        for start, stop, offset in sorted(ranges):
+            if breaks and start < breaks[-1]:
+                raise ValueError("Ranges of a piecewise map must not overlap.")
+            if breaks and start == breaks[-1]:
+                offsets[-1] = offset
+            else:
+                breaks.append(start)
+                offsets.append(offset)
+            breaks.append(stop)
+            offsets.append(0)
+        return cls._merged(breaks, offsets)
+
+    @classmethod
+    def _merged(cls, breaks: list[int], offsets: list[int]) -> Self:
+        """Drops the breaks between pieces with the same offset.
+        """
+        kept_breaks, kept_offsets = [], [offsets[0]]
+        for x, offset in zip(breaks, offsets[1:]):
+            if offset != kept_offsets[-1]:
+                kept_breaks.append(x)
+                kept_offsets.append(offset)
+        return cls(tuple(kept_breaks), tuple(kept_offsets))
+
+    def __call__(self, x: int) -> int:
+        return x + self.offsets[bisect_right(self.breaks, x)]
+
+    def map_many(self, xs: Iterable[int]) -> list[int]:
+        breaks, offsets = self.breaks, self.offsets
+        return [x + offsets[bisect_right(breaks, x)] for x in xs]
+
+    def map_array(self, xs: np.ndarray) -> np.ndarray:
+        """Maps a NumPy integer array at once, locating every element among
+        the breaks with `np.searchsorted`.
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.int64)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        return xs + offsets[np.searchsorted(np.asarray(self.breaks, dtype=np.int64), xs, side='right')]
+
+    def pieces(self, start: int, stop: int) -> Iterator[tuple[int, int, int]]:
+        """Splits [start, stop) at the breaks inside it, yielding
+        (start, stop, offset) for each part.
+        """
+        i = bisect_right(self.breaks, start)
+        while start < stop:
+            end = min(stop, self.breaks[i]) if i < len(self.breaks) else stop
+            yield start, end, self.offsets[i]
+            start, i = end, i + 1
+
+    def image(self, intervals: IntervalSet) -> IntervalSet:
+        """Returns the set of values the map takes on `intervals`.
+        """
+        return IntervalSet.from_intervals(
+            (start + offset, stop + offset)
+            for interval in intervals
+            for start, stop, offset in self.pieces(*interval)
+        )
+
+    def min_image(self, intervals: IntervalSet) -> int:
+        """Returns the least value the map takes on a non-empty `intervals`.
+        Each piece is increasing, so only the starts of the pieces, i.e. the
+        interval starts and the breaks inside the intervals, are evaluated.
+        """
+        return min(
+            start + offset
+            for interval in intervals
+            for start, _, offset in self.pieces(*interval)
+        )
+
+    def then(self, other: PiecewiseMap) -> PiecewiseMap:
+        """Returns the composition `x -> other(self(x))`. Its breaks are those
+        of `self` plus the preimages of the breaks of `other`.
+        """
+        breaks, offsets = [], []
+        bounds = [None, *self.breaks, None]
+        for start, stop, offset in zip(bounds, bounds[1:], self.offsets):
+            # The breaks of `other` met by this piece, shifted back.
+            lo = 0 if start is None else bisect_right(other.breaks, start + offset)
+            hi = len(other.breaks) if stop is None else bisect_left(other.breaks, stop + offset)
+            if start is not None:
+                breaks.append(start)
+            offsets.append(offset + other.offsets[lo])
+            for i in range(lo, hi):
+                breaks.append(other.breaks[i] - offset)
+                offsets.append(offset + other.offsets[i + 1])
+        return PiecewiseMap._merged(breaks, offsets)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import contextlib
+import re
+import time
+
+# Set by the command line programs; the module functions do nothing otherwise.
+ACTIVE: Registry | None = None
+
+_DISABLED_TIMER = contextlib.nullcontext()
+
+
+class Registry:
+    """Counters, gauges and timers of one run, keyed by metric name.
+
+    Solvers should count in a local variable inside hot loops and add the
+    total once, so that metrics cost nothing noticeable even when enabled.
+    """
+
+    def __init__(self):
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, float] = {}
+        # name -> [number of observations, total seconds]
+        self.timers: dict[str, list[float]] = {}
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        timer = self.timers.setdefault(name, [0, 0.0])
+        timer[0] += 1
+        timer[1] += seconds
+
+    @contextlib.contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def to_json(self) -> dict:
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'gauges': dict(sorted(self.gauges.items())),
+            'timers': {
+                name: {'count': count, 'seconds': seconds}
+                for name, (count, seconds) in sorted(self.timers.items())
+            },
+        }
+
+    def to_prometheus(self, prefix: str = 'aoc_') -> str:
+        """Renders the metrics in the Prometheus text exposition format, timers
+        as summaries without quantiles.
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            name = _metric_name(prefix + name) + '_total'
+            lines += [f'# TYPE {name} counter', f'{name} {value}']
+        for name, value in sorted(self.gauges.items()):
+            name = _metric_name(prefix + name)
+            lines += [f'# TYPE {name} gauge', f'{name} {value}']
+        for name, (count, seconds) in sorted(self.timers.items()):
+            name = _metric_name(prefix + name) + '_seconds'
+            lines += [f'# TYPE {name} summary', f'{name}_count {count}', f'{name}_sum {seconds}']
+        return ''.join(line + '\n' for line in lines)
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def enable() -> Registry:
+    """Starts collecting metrics into a new registry, which is returned.
+    """
+    global ACTIVE
+    ACTIVE = Registry()
+    return ACTIVE
+
+
+def disable() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+def count(name: str, n: int = 1) -> None:
+    if ACTIVE is not None:
+        ACTIVE.count(name, n)
+
+
+def gauge(name: str, value: float) -> None:
+    if ACTIVE is not None:
+        ACTIVE.gauge(name, value)
+
+
+def timer(name: str):
+    """Times the body of a with-statement.
+    """
+    if ACTIVE is None:
+        return _DISABLED_TIMER
+    return ACTIVE.timer(name)
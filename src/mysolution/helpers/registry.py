@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import io
+import os
+import re
+import sys
+import time
+from functools import cache, cached_property
+from typing import Any, Callable, Iterable, TextIO
+
+# Kept as a plain string: pathlib is too slow to import for a quick day.
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """Answers of both parts with the wall time, in seconds, spent on
+    `parse`, `part1` and `part2`. Parts answered from the answer store are
+    listed in `cached` and not timed.
+    """
+    answers: tuple[Any, Any]
+    timings: dict[str, float]
+    cached: frozenset[str] = frozenset()
+
+
+@dataclasses.dataclass(frozen=True)
+class Solution:
+    """The in-process interface of a day: `read_input` parses the puzzle from a
+    file object, `part1` and `part2` compute the answers from the parsed puzzle.
+    Days whose records are independent may also provide `stream`, which
+    answers both parts from an iterable of lines in constant memory, and
+    days that parse bytes may provide `read_bytes`, which parses a bytes-like
+    buffer such as a mapped file without decoding it.
+    """
+    day: int
+    read_input: Callable[[TextIO], Any]
+    part1: Callable[[Any], Any]
+    part2: Callable[[Any], Any] | None = None
+    stream: Callable[[Iterable[str]], tuple[Any, Any]] | None = None
+    read_bytes: Callable[[bytes], Any] | None = None
+
+    @cached_property
+    def version(self) -> str:
+        """A hash of the day module's source, which changes whenever the
+        parser or the solver changes.
+        """
+        import hashlib
+
+        module = sys.modules[self.read_input.__module__]
+        with open(module.__file__, 'rb') as fobj:
+            return hashlib.sha256(fobj.read()).hexdigest()[:16]
+
+    def read(self, data: str | bytes) -> Any:
+        """Parses the puzzle from text, or from a bytes-like buffer with
+        `read_bytes` when the day has it.
+        """
+        if isinstance(data, str):
+            return self.read_input(io.StringIO(data))
+        if self.read_bytes is not None:
+            return self.read_bytes(data)
+        return self.read_input(io.StringIO(str(data, 'utf-8')))
+
+    def parse(self, data: str | bytes) -> Any:
+        """Parses the puzzle, going through the parse cache when enabled.
+        """
+        from helpers import cache
+
+        if cache.ACTIVE is None:
+            return self.read(data)
+
+        # A puzzle pickled by a day run as a script refers to `__main__`, and
+        # may hold helper objects whose layout changes with the helpers.
+        version = f'{self.read_input.__module__}-{self.version}-{helpers_version()}'
+        key = cache.ACTIVE.key(self.day, version, data)
+        hit, puzzle = cache.ACTIVE.get(key)
+        if not hit:
+            puzzle = self.read(data)
+            cache.ACTIVE.put(key, puzzle)
+        return puzzle
+
+    def solve(self, data: str | bytes) -> tuple[Any, Any]:
+        """Returns the answers of both parts (None for a missing part). The
+        input is text, a bytes-like buffer or a binary stream.
+        """
+        return self.run(data).answers
+
+    def run(self, data: str | bytes) -> Result:
+        """Solves both parts like `solve()` while timing each step. When the
+        answer store is enabled, stored answers are returned without parsing
+        and new answers are stored.
+        """
+        from helpers import cache
+
+        if not isinstance(data, str) and not _is_buffer(data):
+            data = data.read()  # a binary stream; a mapped file is used as is
+
+        parts = {'part1': self.part1, 'part2': self.part2}
+        answers, timings, cached = {}, {}, set()
+
+        if (store := cache.ANSWERS) is not None:
+            # Answers also change with the helpers the solvers call.
+            version = f'{self.version}-{helpers_version()}'
+            digest = store.digest(data)
+            for part, name in enumerate(parts, 1):
+                hit, answer = store.get(self.day, digest, part, version)
+                if hit:
+                    answers[name] = answer
+                    cached.add(name)
+
+        puzzle = parsed = None
+        for part, (name, func) in enumerate(parts.items(), 1):
+            if name in answers or func is None:
+                continue
+
+            if not parsed:
+                start = time.perf_counter()
+                puzzle, parsed = self.parse(data), True
+                timings['parse'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answers[name] = func(puzzle)
+            timings[name] = time.perf_counter() - start
+
+            if store is not None:
+                store.put(self.day, digest, part, version, answers[name])
+
+        result = Result(
+            answers=(answers.get('part1'), answers.get('part2')),
+            timings=timings,
+            cached=frozenset(cached),
+        )
+        for observer in OBSERVERS:
+            observer(self, result)
+        return result
+
+
+def _is_buffer(data: Any) -> bool:
+    """Tells whether `data` is bytes-like, e.g. bytes or a mapped file.
+    """
+    try:
+        memoryview(data).release()
+    except TypeError:
+        return False
+    return True
+
+
+@cache
+def helpers_version() -> str:
+    """A hash of the sources of the helpers package, which changes whenever
+    a helper used by the parsers or the solvers changes.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    helpers_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(helpers_dir)):
+        if name.endswith('.py'):
+            with open(os.path.join(helpers_dir, name), 'rb') as fobj:
+                digest.update(name.encode() + b'\0' + fobj.read())
+    return digest.hexdigest()[:16]
+
+
+REGISTRY: dict[int, Solution] = {}
+
+# Called with (solution, result) after every run, e.g. to report timings.
+OBSERVERS: list[Callable[[Solution, Result], None]] = []
+
+
+def register(day: int, read_input, part1, part2=None, stream=None, read_bytes=None) -> Solution:
+    """Registers the solution of a day. Called once by each day module.
+    """
+    REGISTRY[day] = solution = Solution(day, read_input, part1, part2, stream, read_bytes)
+    return solution
+
+
+def get_solution(day: int) -> Solution:
+    """Returns the solution of a day, importing its module on first use.
+    """
+    if day not in REGISTRY:
+        importlib.import_module(f'day{day:02d}')
+    return REGISTRY[day]
+
+
+def available_days() -> list[int]:
+    """Lists the days that have a solution module.
+    """
+    return sorted(
+        int(match[1])
+        for name in os.listdir(PACKAGE_DIR)
+        if (match := re.fullmatch(r'day(\d\d)\.py', name))
+    )
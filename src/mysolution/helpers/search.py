@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from array import array
+from heapq import heappop, heappush
+from typing import Callable, Iterable
+
+from helpers import metrics
+
+INF = 2**62
+
+
+def shortest_path(num_states: int, sources: Iterable[int],
+                  neighbors: Callable[[int], Iterable[tuple[int, int]]],
+                  is_goal: Callable[[int], bool],
+                  heuristic: Callable[[int], int] | None = None,
+                  buckets: bool = False) -> int | None:
+    """Returns the cost of the cheapest path from any of the `sources` to a
+    goal state, or None if no goal can be reached.
+
+    States are packed into the ints 0..num_states-1 and their best known costs
+    are kept in a flat array. `neighbors(state)` yields (state, weight) pairs
+    with non-negative integer weights. An admissible and consistent
+    `heuristic` turns the search into A*. With `buckets`, a Dial bucket queue
+    replaces the binary heap, which pays off when weights are small integers.
+    The popped states are counted in the `search_states_popped` metric.
+    """
+    dist = array('q', [INF]) * num_states
+    h = heuristic or (lambda state: 0)
+    push, pop = (_bucket_queue() if buckets else _heap_queue())
+
+    for state in sources:
+        dist[state] = 0
+        push(h(state), 0, state)
+
+    popped = stale = 0
+    try:
+        while (item := pop()) is not None:
+            popped += 1
+            cost, state = item
+            if cost > dist[state]:
+                stale += 1
+                continue  # a cheaper path was found after this one was queued
+            if is_goal(state):
+                return cost
+            for next_state, weight in neighbors(state):
+                if (next_cost := cost + weight) < dist[next_state]:
+                    dist[next_state] = next_cost
+                    push(next_cost + h(next_state), next_cost, next_state)
+        return None
+    finally:
+        metrics.count('search_states_popped', popped)
+        metrics.count('search_stale_pops', stale)
+
+
+def _heap_queue():
+    heap = []
+
+    def push(priority: int, cost: int, state: int) -> None:
+        heappush(heap, (priority, cost, state))
+
+    def pop() -> tuple[int, int] | None:
+        if not heap:
+            return None
+        _, cost, state = heappop(heap)
+        return cost, state
+
+    return push, pop
+
+
+def _bucket_queue():
+    """A monotone priority queue indexed by integer priority: pushes never go
+    below the priority being popped, so popping only scans forward.
+    """
+    buckets: list[list[tuple[int, int]]] = []
+    current = 0
+    size = 0
+
+    def push(priority: int, cost: int, state: int) -> None:
+        nonlocal size
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append((cost, state))
+        size += 1
+
+    def pop() -> tuple[int, int] | None:
+        nonlocal current, size
+        if not size:
+            return None
+        while not buckets[current]:
+            current += 1
+        size -= 1
+        return buckets[current].pop()
+
+    return push, pop
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Runs the solutions of many days in a single process pool and reports
+the answers together with the wall time of each part.
+"""
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import click
+
+from helpers import cache
+from helpers.cli import open_input_bytes
+from helpers.registry import PACKAGE_DIR, available_days, get_solution
+
+INPUTS_DIR = Path(PACKAGE_DIR).parents[1] / 'inputs'
+
+
+@click.command()
+@click.argument('days', nargs=-1, type=click.IntRange(1, 25))
+@click.option('-i', '--inputs', 'inputs_dir', default=INPUTS_DIR, show_default=True,
+              type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Directory containing the dayNN_<suffix>.txt files.")
+@click.option('-s', '--suffix', default='input', show_default=True,
+              help="Input file suffix, e.g. 'sample' for dayNN_sample.txt.")
+@click.option('-j', '--jobs', default=os.cpu_count() or 1, show_default=True,
+              type=click.IntRange(1), help="Number of worker processes.")
+@click.option('--no-cache', is_flag=True, help="Do not use the on-disk caches.")
+def program(days, inputs_dir, suffix, jobs, no_cache):
+    """Solves DAYS (all days by default) in parallel.
+    """
+    jobs_list = []
+    for day in days or available_days():
+        input_file = inputs_dir / f'day{day:02d}_{suffix}.txt'
+        if input_file.exists():
+            jobs_list.append((day, str(input_file)))
+        else:
+            click.echo(f"Day {day:02d}: skipped, {input_file} not found", err=True)
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(jobs_list) or 1)) as executor:
+        futures = [executor.submit(run_day, day, input_file, not no_cache) for day, input_file in jobs_list]
+        for future in as_completed(futures):
+            results.append(result := future.result())
+            click.echo(result, err=True)
+    elapsed = time.perf_counter() - start
+
+    for result in sorted(results):
+        click.echo(result)
+    click.echo(f"Total: {len(results)} days in {elapsed:.3f}s "
+               f"(sum of days {sum(r.elapsed for r in results):.3f}s)")
+
+    if any(result.error for result in results):
+        sys.exit(1)
+
+
+@dataclasses.dataclass(order=True)
+class DayResult:
+    day: int
+    input_file: str
+    answers: tuple = dataclasses.field(default=(), compare=False)
+    timings: dict[str, float] = dataclasses.field(default_factory=dict, compare=False)
+    cached: frozenset[str] = dataclasses.field(default=frozenset(), compare=False)
+    elapsed: float = dataclasses.field(default=0., compare=False)
+    error: str | None = dataclasses.field(default=None, compare=False)
+
+    def to_json(self) -> dict:
+        """A JSON-serializable dict, with answers that are not plain ints or
+        strings (e.g. NumPy integers) converted.
+        """
+        return {
+            'day': self.day,
+            'input_file': self.input_file,
+            'answers': [jsonable(answer) for answer in self.answers],
+            'timings': self.timings,
+            'cached': sorted(self.cached),
+            'elapsed': self.elapsed,
+            'error': self.error,
+        }
+
+    def __str__(self):
+        text = f"Day {self.day:02d}"
+        if 'parse' in self.timings:
+            text += f"  Parse ({self.timings['parse']:.3f}s)"
+        for part, answer in enumerate(self.answers, 1):
+            if (name := f'part{part}') in self.cached:
+                text += f"  Part {part}: {answer} (cached)"
+            elif name in self.timings:
+                text += f"  Part {part}: {answer} ({self.timings[name]:.3f}s)"
+        if self.error:
+            text += f"  Error: {self.error}"
+        return text
+
+
+def jsonable(answer):
+    if answer is None or isinstance(answer, (int, str)):
+        return answer
+    if hasattr(answer, '__index__'):
+        return int(answer)
+    return str(answer)
+
+
+def run_day(day: int, input_file: str, use_cache: bool = True) -> DayResult:
+    """Solves a day on an input file inside a worker.
+    """
+    if use_cache:
+        cache.enable()
+
+    try:
+        with open_input_bytes(input_file) as data:
+            return solve_text(day, data, input_file)
+    except OSError as exc:
+        return DayResult(day, input_file, error=''.join(traceback.format_exception_only(exc)).strip())
+
+
+def solve_text(day: int, data: str | bytes, input_file: str = '-') -> DayResult:
+    """Solves a day on an input already read as text or bytes, or mapped,
+    catching any error into the result.
+    """
+    result = DayResult(day, input_file)
+    start = time.perf_counter()
+    try:
+        solved = get_solution(day).run(data)
+        result.answers, result.timings, result.cached = solved.answers, solved.timings, solved.cached
+    except Exception as exc:
+        result.error = ''.join(traceback.format_exception_only(exc)).strip()
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def preload(days: list[int], use_cache: bool = True) -> None:
+    """Imports the solutions of `days` ahead of their first request, e.g. as
+    the initializer of a worker process.
+    """
+    if use_cache:
+        cache.enable()
+    for day in days:
+        get_solution(day)
+
+
+if __name__ == '__main__':
+    program()
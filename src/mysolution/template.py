@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TextIO, Iterable, Self
 from helpers.cli import command_with_input_file, open_input_file
+from helpers.registry import register
 import dataclasses
 
         
@@ -15,13 +16,9 @@ def program(input_file):
     """Main program.
     """
     with open_input_file(input_file) as fobj:
-        _ = read_input(fobj)
+        p1, p2 = solve(fobj.read())
 
-
-    p1 = 0
     print("Part 1:", p1)
-
-    p2 = 0
     print("Part 2:", p2)
 
    
@@ -40,6 +37,18 @@ class Puzzle:
         return cls()
 
 
+def p1_solve(puzzle: Puzzle):
+    return 0
+
+
+def p2_solve(puzzle: Puzzle):
+    return 0
+
+
+SOLUTION = register(0, read_input, p1_solve, p2_solve)
+solve = SOLUTION.solve
+
+
 if __name__ == '__main__':
     program()
 
@@ -0,0 +1,28 @@
+import time
+
+from helpers.graph import Graph
+
+
+def test_reversed_large_unweighted_graph():
+    # A chain plus a skip edge per node; reversing it used to be quadratic.
+    n = 50_000
+    edges = [(u, u + 1) for u in range(n - 1)] + [(u, u + 2) for u in range(n - 2)]
+    graph = Graph.from_edges(edges, nodes=range(n))
+    start = time.perf_counter()
+    flipped = graph.reversed()
+    # Linear takes well under a second; the quadratic version took tens of seconds.
+    assert time.perf_counter() - start < 10
+
+    assert flipped.weights is None
+    assert flipped.num_edges == graph.num_edges
+    assert list(flipped.successors(0)) == []
+    assert sorted(flipped.successors(n - 1)) == [n - 3, n - 2]
+    assert list(flipped.reversed().successors(7)) == [8, 9]
+
+
+def test_reversed_keeps_weights():
+    graph = Graph.from_edges([('a', 'b', 3), ('b', 'c', 5), ('a', 'c', 7)])
+    flipped = graph.reversed()
+
+    assert flipped.names == graph.names
+    assert sorted(flipped.edges(graph.ids['c'])) == [(graph.ids['a'], 7), (graph.ids['b'], 5)]